@@ -15,12 +15,27 @@ import os
 import hashlib
 import copy
 import asyncio
+import inspect
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.node_registry import node_registry
 
+# Compiled fused-chain functions keyed by generated source, shared across runs
+_FUSED_CODE_CACHE: Dict[str, Any] = {}
+
+
+def _compile_fused_chain(expression: str):
+    """Compile a fused chain expression into a one-argument function (cached)"""
+    source = f"def _fused(value):\n    return {expression}\n"
+    func = _FUSED_CODE_CACHE.get(source)
+    if func is None:
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, "<fused>", "exec"), namespace)
+        func = _FUSED_CODE_CACHE[source] = namespace["_fused"]
+    return func
+
 class ContinuousExecutor:
     """Continuously executes workflows in a loop"""
     
@@ -37,10 +52,19 @@ class ContinuousExecutor:
         
         # Pre-computed execution data for performance optimization
         self._execution_order = []
+        self._execution_levels = []
         self._node_instances = {}
         self._node_data_map = {}
         self._edges = []
+        self._fused_chains = {}
+        self._fused_members = {}
+        # Values of identity nodes with no incoming edges, folded at setup
+        self._identity_constants = {}
         self._is_setup = False
+
+        # Event loop (on its own daemon thread) that runs async node coroutines
+        self._async_loop = None
+        self._async_loop_lock = threading.Lock()
         
     def _broadcast_sync(self, coro):
         """Helper method to run async WebSocket broadcasts from sync thread"""
@@ -180,8 +204,23 @@ class ContinuousExecutor:
                 self._node_instances[node_id] = {
                     "instance": node_instance,
                     "class": node_class,
-                    "function_name": node_class.FUNCTION()
+                    "function_name": node_class.FUNCTION(),
+                    "is_async": node_class.ASYNC,
+                    "is_identity": node_class.IS_IDENTITY
                 }
+
+            # Group nodes into levels whose members don't depend on each other
+            self._execution_levels = self._compute_execution_levels(self._execution_order, edges)
+
+            # Collapse linear chains of pure nodes into compiled functions
+            self._fuse_pure_chains()
+
+            # Identity nodes fed only by their parameters become constants
+            targets = {edge["target"] for edge in edges}
+            self._identity_constants = {}
+            for node_id, node_instance_data in self._node_instances.items():
+                if node_instance_data["is_identity"] and node_id not in targets:
+                    self._fold_identity_node(node_id)
             
             self._is_setup = True
             self.log_message("info", f"Setup completed for {len(self._execution_order)} nodes")
@@ -190,6 +229,88 @@ class ContinuousExecutor:
             self.log_message("error", f"Setup failed: {str(e)}")
             raise
     
+    def _fuse_pure_chains(self):
+        """Find maximal linear chains of PURE nodes and compile each into one function"""
+        fused_chains = {}
+        fused_members = {}
+
+        outgoing = defaultdict(list)
+        incoming = defaultdict(list)
+        for edge in self._edges:
+            outgoing[edge["source"]].append(edge)
+            incoming[edge["target"]].append(edge)
+
+        def fusable(node_id):
+            # Parameters are baked in when the chain compiles, so only the fused
+            # value may arrive by an edge; other edge-fed inputs change per run
+            node_data = self._node_instances.get(node_id)
+            return (node_data is not None and node_data["class"].PURE
+                    and all(edge.get("targetHandle", "input") == node_data["class"].FUSE_INPUT
+                            for edge in incoming[node_id]))
+
+        def fusable_link(edge):
+            # source feeds only target, and target's single input is the fused value
+            source, target = edge["source"], edge["target"]
+            return (fusable(source) and fusable(target)
+                    and len(outgoing[source]) == 1 and len(incoming[target]) == 1)
+
+        for node_id in self._execution_order:
+            if not fusable(node_id) or node_id in fused_members:
+                continue
+            # Only start at chain heads
+            if len(incoming[node_id]) == 1 and fusable_link(incoming[node_id][0]):
+                continue
+
+            chain = [node_id]
+            while len(outgoing[chain[-1]]) == 1 and fusable_link(outgoing[chain[-1]][0]):
+                chain.append(outgoing[chain[-1]][0]["target"])
+
+            fused = self._compile_chain(chain) if len(chain) > 1 else None
+            if fused is not None:
+                fused_chains[chain[-1]] = fused
+                for member_id in chain:
+                    fused_members[member_id] = chain[-1]
+
+        # The execution thread reads these maps while parameters change, so they
+        # are only ever replaced whole, never mutated (see update_node_parameter)
+        self._fused_members = fused_members
+        self._fused_chains = fused_chains
+        if fused_chains:
+            self.log_message("info", f"Fused {len(fused_chains)} pure node chains")
+
+    def _compile_chain(self, chain: List[str]) -> Optional[Dict[str, Any]]:
+        """Generate and compile the fused function for a chain; None if a node can't be fused"""
+        expression = "value"
+        for node_id in chain:
+            node_class = self._node_instances[node_id]["class"]
+            params = self._prepare_node_inputs_optimized(node_id, self._node_data_map[node_id], {})
+            params.pop(node_class.FUSE_INPUT, None)
+            expression = node_class.fuse_expression(expression, **params)
+            if expression is None:
+                return None
+
+        return {
+            "nodes": chain,
+            "func": _compile_fused_chain(expression),
+        }
+
+    def _execute_fused_chain(self, fused: Dict[str, Any], node_results: Dict[str, Any]) -> Any:
+        """Run a fused chain (an entry of _fused_chains) using the chain head's inputs"""
+        head_id = fused["nodes"][0]
+        head_class = self._node_instances[head_id]["class"]
+        inputs = self._prepare_node_inputs_optimized(head_id, self._node_data_map[head_id], node_results)
+        return fused["func"](inputs.get(head_class.FUSE_INPUT))
+
+    def _identity_value(self, node_id: str, node_results: Dict[str, Any]) -> Any:
+        """Value an identity node passes through, read straight from its inputs"""
+        node_class = self._node_instances[node_id]["class"]
+        inputs = self._prepare_node_inputs_optimized(node_id, self._node_data_map[node_id], node_results)
+        return inputs.get(node_class.FUSE_INPUT)
+
+    def _fold_identity_node(self, node_id: str):
+        """Cache the constant output of an identity node that has no incoming edges"""
+        self._identity_constants[node_id] = self._identity_value(node_id, {})
+
     def _execution_loop(self):
         """Main execution loop that runs continuously"""
         self.log_message("info", "Continuous execution loop started")
@@ -260,38 +381,123 @@ class ContinuousExecutor:
         if not self._is_setup:
             self._setup_execution()
             
-        # Execute nodes in pre-computed order
+        # One consistent view of the fused chains for this run; a parameter update
+        # installs new maps, which the next run picks up. Chains are read before
+        # members: update_node_parameter drops a chain's members before the chain.
+        fused_chains = self._fused_chains
+        fused_members = self._fused_members
+
+        # Execute nodes level by level in pre-computed order
         node_results = {}
-        for node_id in self._execution_order:
-            # Broadcast node execution start
-            if self.websocket_manager:
-                self._broadcast_sync(self.websocket_manager.broadcast_node_state(
-                    node_id, "executing", {"start_time": time.time()}
-                ))
-            
+        for level in self._execution_levels:
+            # Start async nodes first so they overlap with the sync nodes of the level
+            pending = {}
+            for node_id in level:
+                if node_id not in fused_members and self._node_instances[node_id]["is_async"]:
+                    self._broadcast_node_state(node_id, "executing", {"start_time": time.time()})
+                    try:
+                        execute_func, inputs = self._bind_node_call(node_id, node_results)
+                        pending[node_id] = execute_func(**inputs)
+                    except Exception as e:
+                        self._cancel_coroutines(pending.values())
+                        self._broadcast_node_state(node_id, "error", {"error": str(e)})
+                        raise e
+            gathered = self._submit_coroutines(pending.values()) if pending else None
+
             try:
-                node_result, rt_update   = self._execute_node_optimized(node_id, node_results)
-                # node_result, rt_update = results[:-1], results[-1]
+                for node_id in level:
+                    if node_id in pending:
+                        continue
+
+                    tail_id = fused_members.get(node_id)
+                    if tail_id is not None:
+                        # Fused chain members run together when the tail is reached
+                        if node_id == tail_id:
+                            fused = fused_chains[node_id]
+                            node_results[node_id] = self._execute_fused_chain(fused, node_results)
+                            for member_id in fused["nodes"]:
+                                self._broadcast_node_state(member_id, "completed", {"rt_update": None})
+                        continue
+
+                    # Broadcast node execution start
+                    self._broadcast_node_state(node_id, "executing", {"start_time": time.time()})
+
+                    try:
+                        node_result, rt_update = self._execute_node_optimized(node_id, node_results)
+                        if node_result is not None:
+                            node_results[node_id] = node_result
+
+                        # Broadcast node execution completed
+                        self._broadcast_node_state(node_id, "completed", {"rt_update": rt_update})
+
+                    except Exception as e:
+                        # Broadcast node error
+                        self._broadcast_node_state(node_id, "error", {"error": str(e)})
+                        raise e
+            finally:
+                results = gathered.result() if gathered else []
+
+            # Collect async node results once the whole level has finished
+            for node_id, result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    self.log_message("error", f"Node {node_id} execution failed: {str(result)}")
+                    self._broadcast_node_state(node_id, "error", {"error": str(result)})
+                    raise result
+                node_result, rt_update = self._split_node_result(node_id, result)
                 if node_result is not None:
                     node_results[node_id] = node_result
-                
-                # Broadcast node execution completed
-                if self.websocket_manager:
-                    self._broadcast_sync(self.websocket_manager.broadcast_node_state(
-                        node_id, "completed", {"rt_update": rt_update}
-                    ))
-                    
-            except Exception as e:
-                # Broadcast node error
-                if self.websocket_manager:
-                    self._broadcast_sync(self.websocket_manager.broadcast_node_state(
-                        node_id, "error", {"error": str(e)}
-                    ))
-                raise e
+                self._broadcast_node_state(node_id, "completed", {"rt_update": rt_update})
         
         # Store results
         self.execution_results = node_results
     
+    def _broadcast_node_state(self, node_id: str, state: str, data: Dict[str, Any]):
+        """Broadcast a node state change if a WebSocket manager is attached"""
+        if self.websocket_manager:
+            self._broadcast_sync(self.websocket_manager.broadcast_node_state(node_id, state, data))
+
+    def _get_async_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop used for async nodes, starting it on first use"""
+        with self._async_loop_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="node-async-loop", daemon=True).start()
+                self._async_loop = loop
+            return self._async_loop
+
+    def _submit_coroutines(self, coroutines):
+        """Run coroutines concurrently on the async loop; returns a future of their results"""
+        async def gather():
+            return await asyncio.gather(*coroutines, return_exceptions=True)
+
+        return asyncio.run_coroutine_threadsafe(gather(), self._get_async_loop())
+
+    def _run_coroutine(self, coroutine):
+        """Run a single coroutine on the async loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_async_loop()).result()
+
+    @staticmethod
+    def _cancel_coroutines(coroutines):
+        """Close coroutines that were created but never scheduled"""
+        for coroutine in coroutines:
+            coroutine.close()
+
+    def _compute_execution_levels(self, execution_order: List[str], edges: List[Dict]) -> List[List[str]]:
+        """Split a topological order into levels; nodes within a level are independent"""
+        predecessors = defaultdict(list)
+        for edge in edges:
+            predecessors[edge["target"]].append(edge["source"])
+
+        depth = {}
+        levels = []
+        for node_id in execution_order:
+            node_depth = 1 + max((depth[p] for p in predecessors[node_id] if p in depth), default=-1)
+            depth[node_id] = node_depth
+            if node_depth == len(levels):
+                levels.append([])
+            levels[node_depth].append(node_id)
+        return levels
+
     def _topological_sort(self, nodes: List[Dict], edges: List[Dict]) -> List[str]:
         """Perform topological sort to determine execution order"""
         # Build adjacency list and in-degree count
@@ -335,45 +541,59 @@ class ContinuousExecutor:
     
     def _execute_node_optimized(self, node_id: str, node_results: Dict[str, Any]) -> Any:
         """Execute a single node using pre-computed instance data for maximum performance"""
+        if self._node_instances[node_id]["is_identity"]:
+            # Forward the input without dispatching a call to the node
+            if node_id in self._identity_constants:
+                return self._identity_constants[node_id], None
+            return self._identity_value(node_id, node_results), None
+
         try:
-            # Get pre-instantiated node data
-            node_instance_data = self._node_instances[node_id]
-            node_instance = node_instance_data["instance"]
-            function_name = node_instance_data["function_name"]
-            
-            # Get node data for input preparation
-            node_data = self._node_data_map[node_id]
-            
-            # Prepare inputs from connected edges and node parameters
-            inputs = self._prepare_node_inputs_optimized(node_id, node_data, node_results)
-            
-            
-            # Validate inputs
-            try:
-                node_instance.validate_inputs(**inputs)
-            except Exception as e:
-                pass
-                
-            # Execute using pre-cached function
-            execute_func = getattr(node_instance, function_name)
+            execute_func, inputs = self._bind_node_call(node_id, node_results)
             result = execute_func(**inputs)
-            
-            # If result is a 2-tuple, use the second element for websocket broadcast
-            rt_update = None
-            node_result = None
-            if isinstance(result, tuple) and len(result) == 2:
-                node_result, rt_update = result
-            else:
-                node_result = result
-                
-            # Log successful execution
-            if self.count_of_iterations % 50 == 0:
-                self.log_message("debug", f"Node {node_id} executed successfully")
-            return node_result, rt_update
+            if inspect.isawaitable(result):
+                result = self._run_coroutine(result)
+            return self._split_node_result(node_id, result)
             
         except Exception as e:
             self.log_message("error", f"Node {node_id} execution failed: {str(e)}")
             raise e
+
+    def _bind_node_call(self, node_id: str, node_results: Dict[str, Any]):
+        """Resolve the node's execute function and its prepared inputs"""
+        # Get pre-instantiated node data
+        node_instance_data = self._node_instances[node_id]
+        node_instance = node_instance_data["instance"]
+        function_name = node_instance_data["function_name"]
+        
+        # Get node data for input preparation
+        node_data = self._node_data_map[node_id]
+        
+        # Prepare inputs from connected edges and node parameters
+        inputs = self._prepare_node_inputs_optimized(node_id, node_data, node_results)
+        
+        # Validate inputs
+        try:
+            node_instance.validate_inputs(**inputs)
+        except Exception as e:
+            pass
+            
+        # Execute using pre-cached function
+        return getattr(node_instance, function_name), inputs
+
+    def _split_node_result(self, node_id: str, result: Any):
+        """Split a node's return value into (node_result, rt_update)"""
+        # If result is a 2-tuple, use the second element for websocket broadcast
+        rt_update = None
+        node_result = None
+        if isinstance(result, tuple) and len(result) == 2:
+            node_result, rt_update = result
+        else:
+            node_result = result
+            
+        # Log successful execution
+        if self.count_of_iterations % 50 == 0:
+            self.log_message("debug", f"Node {node_id} executed successfully")
+        return node_result, rt_update
     
     def _prepare_node_inputs_optimized(self, node_id: str, node_data: Dict, 
                                      node_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -531,6 +751,25 @@ class ContinuousExecutor:
                 if "parameters" not in node_data["data"]:
                     node_data["data"]["parameters"] = {}
                 node_data["data"]["parameters"][parameter_name] = parameter_value
+
+                if node_id in self._identity_constants:
+                    self._fold_identity_node(node_id)
+
+                # Regenerate the fused function if the parameter is baked into one
+                tail_id = self._fused_members.get(node_id)
+                if tail_id is not None:
+                    # Build the replacement first, then swap in new maps in single
+                    # assignments, so a run in progress never sees a missing chain
+                    chain = self._fused_chains[tail_id]["nodes"]
+                    fused = self._compile_chain(chain)
+                    if fused is not None:
+                        self._fused_chains = {**self._fused_chains, tail_id: fused}
+                    else:
+                        # Fall back to running the chain node by node
+                        self._fused_members = {member_id: tail for member_id, tail in self._fused_members.items()
+                                               if tail != tail_id}
+                        self._fused_chains = {tail: entry for tail, entry in self._fused_chains.items()
+                                              if tail != tail_id}
                 
                 self.log_message("info", f"Updated node {node_id} parameter {parameter_name}")
                 return True
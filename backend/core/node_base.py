@@ -1,10 +1,119 @@
+import os
+import sys
+import traceback
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+# Metadata classmethods that cached_node_metadata evaluates once per class
+NODE_METADATA_METHODS = (
+    "INPUT_TYPES",
+    "RETURN_TYPES",
+    "FUNCTION",
+    "TAGS",
+    "DISPLAY_NAME",
+    "DESCRIPTION",
+    "get_detailed_description",
+)
+
+
+# Set FACTORYUI_DEBUG_TB=1 to append full tracebacks to node error messages; by
+# default nodes report just the exception, without formatting the stack
+DEBUG_TRACEBACKS = os.environ.get("FACTORYUI_DEBUG_TB") == "1"
+
+
+def error_traceback() -> str:
+    """Traceback suffix for a node error message ('' unless FACTORYUI_DEBUG_TB=1)"""
+    return "\n" + traceback.format_exc() if DEBUG_TRACEBACKS else ""
+
+
+def freeze_metadata(value: Any) -> Any:
+    """Recursively make node metadata immutable (dicts -> MappingProxyType, lists -> tuples, strings interned)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_metadata(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_metadata(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def thaw_metadata(value: Any) -> Any:
+    """Plain dict/list copy of (possibly frozen) metadata, for JSON responses"""
+    if isinstance(value, Mapping):
+        return {key: thaw_metadata(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_metadata(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class NodeSchema:
+    """A node class's metadata as plain data, so readers don't call the classmethods"""
+    input_types: Any
+    return_types: Any
+    function: str
+    tags: Any
+    display_name: str
+    description: str
+    detailed_description: str = ""
+
+    @classmethod
+    def from_node_class(cls, node_class) -> "NodeSchema":
+        return cls(
+            input_types=node_class.INPUT_TYPES(),
+            return_types=node_class.RETURN_TYPES(),
+            function=node_class.FUNCTION(),
+            tags=node_class.TAGS(),
+            display_name=node_class.DISPLAY_NAME(),
+            description=node_class.DESCRIPTION(),
+            detailed_description=node_class.get_detailed_description(),
+        )
+
+
+def _constant(value: Any):
+    return lambda: value
+
+
+def cached_node_metadata(cls):
+    """Class decorator: evaluate the metadata classmethods once, at class definition.
+
+    Each method is replaced by a staticmethod returning the frozen result, so
+    repeated introspection doesn't rebuild the same dicts, lists and strings.
+    The frozen values are also collected into cls.SCHEMA.
+    """
+    for name in NODE_METADATA_METHODS:
+        if hasattr(cls, name):
+            setattr(cls, name, staticmethod(_constant(freeze_metadata(getattr(cls, name)()))))
+    cls.SCHEMA = NodeSchema.from_node_class(cls)
+    return cls
+
+
 class NodeBase(ABC):
     """Base class for all nodes in the workflow system"""
-    
+
+    # Set on each instance by the executor when a WebSocket manager is attached
+    __slots__ = ("_websocket_manager", "_node_id")
+
+    # Pure nodes are side-effect free string transforms that the executor may
+    # fuse into a single compiled function (see fuse_expression)
+    PURE = False
+    # Name of the input that carries the value through a fused chain
+    FUSE_INPUT = "input"
+    # Identity nodes return their FUSE_INPUT unchanged; the executor forwards the
+    # value without calling the node
+    IS_IDENTITY = False
+    # Async nodes implement their FUNCTION as a coroutine; the executor runs the
+    # async nodes of one dependency level concurrently
+    ASYNC = False
+    # Long-form help text shown in the UI; returned by get_detailed_description
+    DETAILED_DESCRIPTION = ""
+    # Frozen metadata, set by cached_node_metadata; None means call the classmethods
+    SCHEMA: Optional[NodeSchema] = None
+
     @classmethod
     @abstractmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -37,13 +146,32 @@ class NodeBase(ABC):
     def DESCRIPTION(cls) -> str:
         """Description of what the node does"""
         return ""
-    
+
+    @classmethod
+    def get_detailed_description(cls) -> str:
+        """Detailed description of the node's inputs, outputs and usage"""
+        return cls.DETAILED_DESCRIPTION
+
+    @classmethod
+    def fuse_expression(cls, value: str, **params) -> Optional[str]:
+        """Python expression computing the output from the `value` expression.
+
+        Only consulted for PURE nodes; return None if these params can't be fused.
+        """
+        return None
+
+    @classmethod
+    def required_input_names(cls) -> tuple:
+        """Names of the required inputs, computed once per class"""
+        names = cls.__dict__.get("_REQUIRED_INPUT_NAMES")
+        if names is None:
+            names = tuple(cls.INPUT_TYPES().get("required", {}))
+            cls._REQUIRED_INPUT_NAMES = names
+        return names
+
     def validate_inputs(self, **kwargs) -> bool:
         """Validate input parameters"""
-        input_types = self.INPUT_TYPES()
-        required_inputs = input_types.get("required", {})
-        
-        for key, type_info in required_inputs.items():
+        for key in self.required_input_names():
             if key not in kwargs:
                 raise ValueError(f"Missing required input: {key}")
         
@@ -2,7 +2,7 @@ import os
 import importlib.util
 import inspect
 from typing import Dict, Type, List
-from .node_base import NodeBase
+from .node_base import NodeBase, NodeSchema, thaw_metadata
 
 class NodeRegistry:
     """Registry for discovering and managing node classes"""
@@ -10,6 +10,8 @@ class NodeRegistry:
     def __init__(self):
         self.nodes: Dict[str, Type[NodeBase]] = {}
         self.node_mappings: Dict[str, str] = {}
+        # Node metadata is static per class, so API responses are built once
+        self._node_info_cache: Dict[str, Dict] = {}
     
     def register_node(self, node_class: Type[NodeBase], name: str = None) -> None:
         """Register a single node class"""
@@ -19,6 +21,7 @@ class NodeRegistry:
         node_name = name or node_class.__name__
         self.nodes[node_name] = node_class
         self.node_mappings[node_name] = node_class.__name__
+        self._node_info_cache.pop(node_name, None)
         print(f"Registered node: {node_name}")
     
     def discover_nodes(self, directory: str) -> None:
@@ -67,28 +70,46 @@ class NodeRegistry:
     
     def get_node_info(self, name: str) -> Dict:
         """Get node information for API response"""
+        node_info = self._node_info_cache.get(name)
+        if node_info is not None:
+            return node_info
+
         node_class = self.get_node(name)
         if not node_class:
             return None
         
-        # Get detailed description if available
-        detailed_description = ""
-        if hasattr(node_class, 'get_detailed_description'):
-            try:
-                detailed_description = node_class.get_detailed_description()
-            except Exception as e:
-                print(f"Warning: Failed to get detailed description for {name}: {e}")
+        schema = node_class.SCHEMA
+        if schema is None:
+            # Get detailed description if available
+            detailed_description = ""
+            if hasattr(node_class, 'get_detailed_description'):
+                try:
+                    detailed_description = node_class.get_detailed_description()
+                except Exception as e:
+                    print(f"Warning: Failed to get detailed description for {name}: {e}")
+
+            schema = NodeSchema(
+                input_types=node_class.INPUT_TYPES(),
+                return_types=node_class.RETURN_TYPES(),
+                function=node_class.FUNCTION(),
+                tags=node_class.TAGS(),
+                display_name=node_class.DISPLAY_NAME(),
+                description=node_class.DESCRIPTION(),
+                detailed_description=detailed_description,
+            )
         
-        return {
+        node_info = {
             "name": name,
-            "display_name": node_class.DISPLAY_NAME(),
-            "description": node_class.DESCRIPTION(),
-            "detailed_description": detailed_description,
-            "tags": node_class.TAGS(),
-            "input_types": node_class.INPUT_TYPES(),
-            "return_types": node_class.RETURN_TYPES(),
-            "function": node_class.FUNCTION()
+            "display_name": schema.display_name,
+            "description": schema.description,
+            "detailed_description": schema.detailed_description,
+            "tags": thaw_metadata(schema.tags),
+            "input_types": thaw_metadata(schema.input_types),
+            "return_types": thaw_metadata(schema.return_types),
+            "function": schema.function
         }
+        self._node_info_cache[name] = node_info
+        return node_info
     
     def get_all_node_info(self) -> List[Dict]:
         """Get information for all registered nodes"""
@@ -1,27 +1,317 @@
 import time
 import random
+import atexit
+import operator
+import queue
+import struct
 import sys
+import threading
 import os
 import re
-import traceback
-from typing import Any, Dict, List
-from core.node_base import NodeBase
-
-# Add feetech-servo-sdk to path for robot connectivity
+import importlib.util
+import logging
+import logging.handlers
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
+from core.node_base import NodeBase, cached_node_metadata, error_traceback
+
+if TYPE_CHECKING:
+    from feetech_servo import ScsServoSDK
+
+# feetech-servo-sdk is bundled next to this file for robot connectivity; it is only
+# loaded when a robot is first connected, so non-robot workflows never import it
 feetech_path = os.path.join(os.path.dirname(__file__), 'feetech-servo-sdk')
-sys.path.insert(0, feetech_path)
 
 
-import http.client
+def _load_feetech_servo():
+    """Load the bundled feetech_servo package once, without adding it to sys.path"""
+    module = sys.modules.get("feetech_servo")
+    if module is None:
+        package_dir = os.path.join(feetech_path, "feetech_servo")
+        spec = importlib.util.spec_from_file_location(
+            "feetech_servo",
+            os.path.join(package_dir, "__init__.py"),
+            submodule_search_locations=[package_dir],
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["feetech_servo"] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules["feetech_servo"]
+            raise
+    return module
+
 import json
 import base64
 import asyncio
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 MODULE_TAG = "Basic"
 
+# Operation name -> callable for TextProcessorNode and MathNode (one dict lookup per call)
+_TEXT_OPS = {
+    "uppercase": str.upper,
+    "lowercase": str.lower,
+    "reverse": lambda text: text[::-1],
+    "length": lambda text: str(len(text)),
+}
+# TextProcessorNode operations as source templates for fused chains
+_TEXT_FUSE_TEMPLATES = {
+    "uppercase": "({}).upper()",
+    "lowercase": "({}).lower()",
+    "reverse": "({})[::-1]",
+    "length": "str(len({}))",
+}
+_MATH_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+# Servo IDs of the arm's joints, base to gripper
+_ARM_SERVO_IDS = (1, 2, 3, 4, 5, 6)
+
+# Serial ports accepted by ConnectRobotNode (empty means auto-detect)
+_PORT_NAME_RE = re.compile(r"^(/dev/\S+|COM\d+)?$")
+
+
+logger = logging.getLogger(__name__)
+
+class RobotConnectionError(ConnectionError):
+    """Raised when a robot serial connection cannot be established"""
+
+
+# Console output from the print/display nodes is logged through a queue; a listener
+# thread does the stdout writes so node execution never blocks on them
+_output_log = logging.getLogger("factoryui.output")
+_output_log.setLevel(logging.INFO)
+_output_log.propagate = False
+_OUTPUT_QUEUE = queue.SimpleQueue()
+_output_log.addHandler(logging.handlers.QueueHandler(_OUTPUT_QUEUE))
+_OUTPUT_LISTENER = logging.handlers.QueueListener(_OUTPUT_QUEUE, logging.StreamHandler(sys.stdout))
+_OUTPUT_LISTENER.start()
+atexit.register(_OUTPUT_LISTENER.stop)
+
+
+# Leading 4 bytes of common image formats -> data URL subtype
+_IMAGE_SIGNATURES = {
+    b'\x89PNG': "png",
+    b'\xff\xd8\xff\xe0': "jpeg",
+    b'\xff\xd8\xff\xe1': "jpeg",
+    b'\xff\xd8\xff\xdb': "jpeg",
+    b'\xff\xd8\xff\xee': "jpeg",
+    b'<svg': "svg+xml",
+}
+
+
+def _sniff_image_format(image) -> str:
+    """Detect the image format from its leading bytes (defaults to png)"""
+    # One small copy of the header serves every check below
+    head = bytes(memoryview(image)[:100])
+    image_format = _IMAGE_SIGNATURES.get(head[:4])
+    if image_format is not None:
+        return image_format
+    # Rare cases: other JPEG markers, or SVG behind an XML declaration/comment/doctype
+    # (an XML prolog alone isn't enough: the document must contain an <svg element)
+    if head.startswith(b'\xff\xd8'):
+        return "jpeg"
+    if b'<svg' in head:
+        return "svg+xml"
+    return "png"
+
+
+@dataclass
+class ImagePayload:
+    """IMAGE value parsed once at the source and forwarded unchanged by later nodes"""
+    data: Any  # base64 str when is_b64, otherwise raw image bytes (memoryview)
+    format: str = "png"
+    is_b64: bool = False
+
+
+def _parse_data_url(url: str) -> ImagePayload:
+    """Split a 'data:image/<format>;base64,<data>' URL without decoding the data"""
+    header, sep, base64_data = url.partition(',')
+    if not sep:
+        raise ValueError("missing ',' separator")
+    # header is "data:image/<format>[;base64]"
+    image_format = header[len('data:image/'):].partition(';')[0] or 'png'
+    return ImagePayload(base64_data, image_format, is_b64=True)
+
+
+def _b64encode_str(data: bytes) -> str:
+    """Base64-encode bytes straight to str (SIMD-accelerated when pybase64 is installed)"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
+
+
+def _image_count(images) -> int:
+    """Number of images in an IMAGE value: the batch dimension of an array/tensor, else its length"""
+    try:
+        # ndarray / torch tensor batches: read the leading dimension directly
+        return images.shape[0]
+    except (AttributeError, IndexError):
+        pass
+    try:
+        return len(images)
+    except TypeError:
+        return 1
+
+
+_HTTP_POOL = None
+
+
+def _get_http_pool():
+    """Shared keep-alive urllib3 pool for the HTTP nodes, created on first use.
+
+    Reusing pooled connections avoids a TCP/TLS handshake on every workflow run.
+    """
+    global _HTTP_POOL
+    if _HTTP_POOL is None:
+        import urllib3
+
+        pool = urllib3.PoolManager(num_pools=4, maxsize=16)
+        atexit.register(pool.clear)
+        _HTTP_POOL = pool
+    return _HTTP_POOL
+
+
+_ASYNC_HTTP_CLIENT = None
+
+
+def _get_async_http_client():
+    """Shared httpx client for the HTTP nodes; multiplexes over HTTP/2 when h2 is installed"""
+    global _ASYNC_HTTP_CLIENT
+    if _ASYNC_HTTP_CLIENT is None:
+        try:
+            import h2  # noqa: F401  (httpx's optional HTTP/2 backend)
+            http2 = True
+        except ImportError:
+            http2 = False
+        _ASYNC_HTTP_CLIENT = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _ASYNC_HTTP_CLIENT
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse a JSON response body (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def _http_request(method: str, url: str, body: Optional[bytes] = None,
+                        headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> tuple:
+    """Issue an HTTP request without blocking the event loop; returns (status, body bytes).
+
+    Uses httpx when available, otherwise runs the pooled urllib3 request in a thread.
+    """
+    if httpx is not None:
+        response = await _get_async_http_client().request(method, url, content=body, headers=headers, timeout=timeout)
+        return response.status_code, response.content
+
+    def request():
+        response = _get_http_pool().request(method, url, body=body, headers=headers, timeout=timeout)
+        return response.status, response.data
+
+    return await asyncio.to_thread(request)
+
+
+if msgspec is not None:
+    class _ProxyData(msgspec.Struct):
+        payload: Any
+
+    class _ProxyEnvelope(msgspec.Struct):
+        """The {"data": {"payload": ...}} envelope proxy endpoints respond with"""
+        data: _ProxyData
+
+    # Typed decoder: validates the envelope and builds no dict for it
+    _PROXY_ENVELOPE_DECODER = msgspec.json.Decoder(_ProxyEnvelope)
+else:
+    _PROXY_ENVELOPE_DECODER = None
+
+
+def _decode_proxy_payload(body: bytes) -> Any:
+    """Extract data.payload from a proxy response body"""
+    if _PROXY_ENVELOPE_DECODER is not None:
+        return _PROXY_ENVELOPE_DECODER.decode(body).data.payload
+    return _loads_json(body)['data']['payload']
+
+
+# Response bodies larger than this are stream-parsed with ijson when it's installed
+_STREAM_DECODE_THRESHOLD = 1_000_000
+
+
+class _AsyncByteReader:
+    """Async file-like view of an httpx response body, for ijson's async parser"""
+
+    def __init__(self, response, chunk_size: int = 65536):
+        self._chunks = response.aiter_bytes(chunk_size)
+
+    async def read(self, size: int = -1) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _http_post_json(url: str, obj: Any, timeout: float = 10) -> tuple:
+    """POST obj as a JSON body through the shared HTTP client"""
+    return await _http_request("POST", url, body=_dumps_json(obj),
+                               headers={"Content-Type": "application/json"}, timeout=timeout)
+
+
+@cached_node_metadata
 class InputNode(NodeBase):
     """Basic input node for providing data to the workflow"""
+
+    __slots__ = ()
+
+    PURE = True
+    IS_IDENTITY = True
+    FUSE_INPUT = "value"
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -55,9 +345,7 @@ class InputNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Provides input data to the workflow"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 InputNode
 
 Purpose: Provides input data to the workflow by allowing users to enter text values manually.
@@ -69,13 +357,20 @@ Outputs:
   - output (ANY): The same value that was input, passed through to connected nodes
 
 Usage: Use this node to inject text data into your workflow, either by setting a default value or connecting it to other nodes that provide string data.
-        """
+    """
     
+    @classmethod
+    def fuse_expression(cls, value: str, **params) -> str:
+        return value
+
     def execute(self, value: str) -> str:
         return value
 
+@cached_node_metadata
 class OutputNode(NodeBase):
     """Basic output node for displaying workflow results"""
+
+    __slots__ = ()
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -109,9 +404,7 @@ class OutputNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Displays workflow output"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 OutputNode
 
 Purpose: Displays workflow output by printing the input value to the console and passing it through.
@@ -123,14 +416,20 @@ Outputs:
   - output (STRING): The same value that was input, after displaying it
 
 Usage: Use this node at the end of your workflow to see the final results. It will print the value to the console and also pass it through for further processing if needed.
-        """
+    """
     
     def execute(self, input: str) -> str:
-        print(f"Output: {input}")
+        _output_log.info("Output: %s", input)
         return input
 
+@cached_node_metadata
 class TextProcessorNode(NodeBase):
     """Process text with various transformations"""
+
+    __slots__ = ()
+
+    PURE = True
+    FUSE_INPUT = "text"
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -165,9 +464,7 @@ class TextProcessorNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Apply text transformations"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 TextProcessorNode
 
 Purpose: Applies various text transformations to input strings.
@@ -184,23 +481,28 @@ Outputs:
   - output (STRING): The transformed text result
 
 Usage: Use this node to manipulate text data in your workflow. Select the desired operation from the dropdown to transform your input text.
-        """
+    """
     
+    @classmethod
+    def fuse_expression(cls, value: str, operation: str = "uppercase", **params) -> Optional[str]:
+        template = _TEXT_FUSE_TEMPLATES.get(operation)
+        return template.format(value) if template else None
+
     def execute(self, text: str, operation: str) -> str:
-        if operation == "uppercase":
-            return text.upper()
-        elif operation == "lowercase":
-            return text.lower()
-        elif operation == "reverse":
-            return text[::-1]
-        elif operation == "length":
-            return str(len(text))
-        else:
-            return text
+        try:
+            op = _TEXT_OPS[operation]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation}") from None
+        return op(text)
 
+@cached_node_metadata
 class DelayNode(NodeBase):
     """A node that introduces a delay in workflow execution."""
 
+    __slots__ = ()
+
+    ASYNC = True
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -234,9 +536,7 @@ class DelayNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Pause workflow execution for a specified number of seconds."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 DelayNode
 
 Purpose: Introduces a configurable delay (pause) in the workflow, which is useful for timing control, synchronization, or rate limiting.
@@ -249,15 +549,21 @@ Outputs:
   - output (ANY): The same input value, returned after the delay.
 
 Usage: Use this node to add a pause in your workflow. This is helpful when you need to wait between hardware commands, throttle API calls, or synchronize steps in your process.
-        """
+    """
 
-    def execute(self, input, delay_seconds: float):
-        import time
-        time.sleep(float(delay_seconds))
+    async def execute(self, input, delay_seconds: float):
+        await asyncio.sleep(float(delay_seconds))
         return input
 
+@cached_node_metadata
 class RandomNumberNode(NodeBase):
     """Generate random numbers"""
+
+    __slots__ = ("_rng",)
+
+    def __init__(self):
+        # Per-node generator instead of the shared module-level random instance
+        self._rng = random.Random()
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -292,9 +598,7 @@ class RandomNumberNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Generate random integer between min and max values"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 RandomNumberNode
 
 Purpose: Generates random integer values within a specified range.
@@ -307,13 +611,84 @@ Outputs:
   - output (INT): A random integer between min_value and max_value (inclusive)
 
 Usage: Use this node to introduce randomness into your workflow, such as for testing, simulations, or generating varied inputs for robot movements.
-        """
+    """
     
     def execute(self, min_value: int, max_value: int) -> int:
-        return random.randint(min_value, max_value)
+        return self._rng.randrange(min_value, max_value + 1)
+
+@cached_node_metadata
+class RandomNumberBatchNode(NodeBase):
+    """Generate a batch of random numbers in a single draw"""
+
+    __slots__ = ("_np_rng", "_rng")
+
+    def __init__(self):
+        # Generators are created once per node and reused for every batch
+        self._np_rng = np.random.default_rng() if np is not None else None
+        self._rng = random.Random()
+    
+    @classmethod
+    def INPUT_TYPES(cls) -> Dict[str, Any]:
+        return {
+            "required": {
+                "min_value": ("INT", {"default": 0}),
+                "max_value": ("INT", {"default": 100}),
+                "count": ("INT", {"default": 10, "min": 1})
+            }
+        }
+    
+    @classmethod
+    def RETURN_TYPES(cls) -> Dict[str, Any]:
+        return {
+            "required": {
+                "output": ("INT_ARRAY", {})
+            }
+        }
+    
+    @classmethod
+    def FUNCTION(cls) -> str:
+        return "execute"
+    
+    @classmethod
+    def TAGS(cls) -> List[str]:
+        return [MODULE_TAG]
+    
+    @classmethod
+    def DISPLAY_NAME(cls) -> str:
+        return "Random Number Batch"
+    
+    @classmethod
+    def DESCRIPTION(cls) -> str:
+        return "Generate a list of random integers between min and max values"
+    
+    DETAILED_DESCRIPTION = """
+RandomNumberBatchNode
+
+Purpose: Generates many random integer values within a specified range in one call, instead of chaining several Random Number nodes.
+
+Inputs:
+  - min_value (INT): The minimum value for the random numbers (default: 0)
+  - max_value (INT): The maximum value for the random numbers (default: 100)
+  - count (INT): How many random numbers to generate (default: 10)
+
+Outputs:
+  - output (INT_ARRAY): A list of random integers between min_value and max_value (inclusive)
 
+Usage: Use this node when a workflow needs several random values at once, such as randomized robot targets or test inputs. The values are drawn with a single vectorized NumPy call when NumPy is installed.
+    """
+    
+    def execute(self, min_value: int, max_value: int, count: int) -> List[int]:
+        if self._np_rng is not None:
+            return self._np_rng.integers(min_value, max_value + 1, size=int(count)).tolist()
+        randrange = self._rng.randrange
+        stop = max_value + 1
+        return [randrange(min_value, stop) for _ in range(int(count))]
+
+@cached_node_metadata
 class MathNode(NodeBase):
     """Perform basic mathematical operations"""
+
+    __slots__ = ()
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -349,9 +724,7 @@ class MathNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Perform basic mathematical operations"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 MathNode
 
 Purpose: Performs basic mathematical operations on two floating-point numbers.
@@ -363,32 +736,29 @@ Inputs:
     * add: a + b
     * subtract: a - b
     * multiply: a * b
-    * divide: a / b (throws error if b is 0)
+    * divide: a / b (raises ZeroDivisionError if b is 0)
 
 Outputs:
   - output (FLOAT): The result of the mathematical operation
 
 Usage: Use this node for calculations in your workflow, such as converting units, scaling values, or performing computations on sensor data.
-        """
+    """
     
     def execute(self, a: float, b: float, operation: str) -> float:
-        if operation == "add":
-            return a + b
-        elif operation == "subtract":
-            return a - b
-        elif operation == "multiply":
-            return a * b
-        elif operation == "divide":
-            if b == 0:
-                raise ValueError("Division by zero")
-            return a / b
-        else:
-            raise ValueError(f"Unknown operation: {operation}")
+        try:
+            op = _MATH_OPS[operation]
+        except KeyError:
+            raise ValueError(f"Unknown operation: {operation}") from None
+        # Division by zero raises ZeroDivisionError from the operator itself
+        return op(a, b)
 
 
+@cached_node_metadata
 class PrintToConsoleNode(NodeBase):
     """A node that prints the input value and returns no output."""
 
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -417,9 +787,7 @@ class PrintToConsoleNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Prints the input value to the console."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 PrintToConsoleNode
 
 Purpose: Prints any input value to the console for debugging and monitoring purposes.
@@ -431,16 +799,26 @@ Outputs:
   - None (this node has no outputs)
 
 Usage: Use this node to debug your workflow by printing intermediate values to the console. Place it anywhere in your workflow to see what data is flowing through.
-        """
+    """
 
     def execute(self, value: Any):
-        print(value)
+        _output_log.info("%s", value)
 
+@cached_node_metadata
 class ConnectRobotNode(NodeBase):
     """Connect to a robot and return ScsServoSDK instance"""
-    
-    def __init__(self):
-        self.port2sdk = {}
+
+    __slots__ = ()
+
+    ASYNC = True
+    # Connected SDKs per port, shared by every ConnectRobotNode in the process so a
+    # re-created node or a second workflow reuses the open serial connection
+    _PORT2SDK: ClassVar["OrderedDict[Any, ScsServoSDK]"] = OrderedDict()
+    # Serializes connects so two runs racing on one port don't both open it
+    _PORT2SDK_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    # The least recently used SDK is disconnected beyond this many ports
+    MAX_CACHED_SDKS = 8
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -473,9 +851,7 @@ class ConnectRobotNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return """Connect to a robot using ScsServoSDK.connect() and return SDK instance."""
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 ConnectRobotNode
 
 Purpose: Establishes a connection to a robot using the ScsServoSDK and returns the SDK instance for use by other robot control nodes.
@@ -487,41 +863,93 @@ Outputs:
   - sdk (ScsServoSDK): The connected SDK instance that can be used by other robot control nodes
 
 Usage: Use this node at the beginning of robot workflows to establish communication. The SDK output should be connected to other robot nodes that require servo control. If port_name is empty, the system will attempt to auto-detect the robot.
-        """
+    """
     
-    def connect_robot(self, port_name: str) -> tuple:
+    async def connect_robot(self, port_name: str) -> tuple:
         """Connect to robot and return SDK instance"""
         
-        if port_name in self.port2sdk:
-            return (self.port2sdk[port_name],)
-
-        sdk = ScsServoSDK()
-    
-        # Connect to servo controller
-        # If port_name is empty, pass None to auto-detect
-        port_to_use = port_name if port_name.strip() else None
-        success = sdk.connect(port_name=port_to_use)
-        
-        if not success:
-            raise Exception("Failed to connect to robot")
-        
-        print(f"✓ Robot connected successfully")
-        if sdk.port_handler:
-            print(f"  Port: {sdk.port_handler.port_name}")
-        
+        # Normalize once: empty means auto-detect (None), and is also the cache key
+        port_to_use = port_name.strip() or None
+        sdk = self._PORT2SDK.get(port_to_use)
+        if sdk is not None:
+            # Refresh LRU order only if that doesn't mean waiting on a connect in progress
+            if self._PORT2SDK_LOCK.acquire(blocking=False):
+                try:
+                    if port_to_use in self._PORT2SDK:
+                        self._PORT2SDK.move_to_end(port_to_use)
+                finally:
+                    self._PORT2SDK_LOCK.release()
+            return (sdk, None)
+
+        if not _PORT_NAME_RE.match(port_to_use or ""):
+            raise ValueError(f"Invalid port name: {port_name!r}")
+
+        # Serial open/handshake blocks (as does waiting for another connect); keep both off the event loop
+        sdk = await asyncio.to_thread(self._connect_locked, port_to_use)
+        return (sdk, None)
 
-        self.port2sdk[port_name] = sdk
+    @classmethod
+    def _connect_locked(cls, port):
+        """Return the shared SDK for port, connecting it under the cache lock if needed"""
+        with cls._PORT2SDK_LOCK:
+            # Another run may have connected this port while we waited
+            sdk = cls._PORT2SDK.get(port)
+            if sdk is not None:
+                cls._PORT2SDK.move_to_end(port)
+                return sdk
 
-        return (sdk, None)
+            sdk = _load_feetech_servo().ScsServoSDK()
+        
+            # Connect to servo controller
+            try:
+                success = sdk.connect(port_name=port)
+            except OSError as e:
+                # pyserial's SerialException is an OSError subclass
+                raise RobotConnectionError(f"Failed to connect to robot on {port or 'auto-detected port'}") from e
+            
+            if not success:
+                raise RobotConnectionError("Failed to connect to robot")
+            
+            print(f"✓ Robot connected successfully")
+            if sdk.port_handler:
+                print(f"  Port: {sdk.port_handler.port_name}")
+
+            cls._PORT2SDK[port] = sdk
+            cls._evict_stale_sdks()
+            return sdk
+
+    @classmethod
+    def _evict_stale_sdks(cls):
+        """Disconnect least recently used SDKs beyond MAX_CACHED_SDKS (caller holds the lock)"""
+        while len(cls._PORT2SDK) > cls.MAX_CACHED_SDKS:
+            port, sdk = cls._PORT2SDK.popitem(last=False)
+            try:
+                sdk.disconnect()
+            except Exception as e:
+                print(f"Warning: Failed to disconnect robot on {port}: {e}")
+
+    @classmethod
+    def forget_sdk(cls, sdk) -> None:
+        """Drop sdk from the cache (it is being disconnected), so later connects open the port again"""
+        with cls._PORT2SDK_LOCK:
+            for port in [port for port, cached in cls._PORT2SDK.items() if cached is sdk]:
+                del cls._PORT2SDK[port]
      
+@cached_node_metadata
 class ShowImageNode(NodeBase):
     """A node that shows an image (takes image input, no output)."""
 
+    __slots__ = ("_rt",)
+
+    def __init__(self):
+        # rt_update dict reused for every frame
+        self._rt = {"image_base64": None, "image_format": None, "error": None}
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
             "required": {
-                "image": ("IMAGE", {})  # Accepts bytes or base64 string
+                "image": ("IMAGE", {})  # Accepts ImagePayload, bytes or base64 string
             }
         }
 
@@ -545,9 +973,7 @@ class ShowImageNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Show an image in the UI (takes image input, no output)."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 ShowImageNode
 
 Purpose: Shows an image in the UI. This node takes an image input (bytes or base64 string) and produces no output. Intended for UI demonstration or static image display in workflows.
@@ -559,61 +985,66 @@ Outputs:
   - None
 
 Usage: Use this node to display an image in your workflow. The backend will print a message, and the frontend can render the image.
-        """
+    """
 
     def show_image(self, image):
         # Pass through the image for UI rendering (if needed)
-        rt_update = {}
-
-
+        image_b64 = None
+        image_format = None
+        error = None
         
         try:
-            if isinstance(image, bytes):
+            if isinstance(image, ImagePayload):
+                # Already base64 payloads go out as-is; raw ones are encoded once here
+                image_b64 = image.data if image.is_b64 else _b64encode_str(image.data)
+                image_format = image.format
+
+            elif isinstance(image, bytes):
                 # Convert bytes to base64
-                image_b64 = base64.b64encode(image).decode("utf-8")
-                # Try to detect format from content
-                if image.startswith(b'<svg') or b'<svg' in image[:100]:
-                    image_format = "svg+xml"
-                elif image.startswith(b'\x89PNG'):
-                    image_format = "png"
-                elif image.startswith(b'\xff\xd8'):
-                    image_format = "jpeg"
-                else:
-                    image_format = "png"  # Default
-                rt_update = {"image_base64": image_b64, "image_format": image_format}
+                image_b64 = _b64encode_str(image)
+                # Detect format from content
+                image_format = _sniff_image_format(image)
                 
             elif isinstance(image, str):
                 # Check if it's already a data URL
                 if image.startswith('data:image/'):
                     try:
-                        header, base64_data = image.split(',', 1)
-                        format_match = re.match(r'data:image/([^;]+)', header)
-                        image_format = format_match.group(1) if format_match else 'png'
-                        rt_update = {"image_base64": base64_data, "image_format": image_format}
+                        payload = _parse_data_url(image)
+                        image_b64, image_format = payload.data, payload.format
                     except Exception as e:
-                        rt_update = {"error": f"Invalid data URL format: {e}\n{traceback.format_exc()}"}
+                        error = f"Invalid data URL format: {e}{error_traceback()}"
                 else:
-                    # Assume it's already base64, try to detect format
-                    if image.startswith('<svg') or '<svg' in image[:100]:
+                    # Assume it's already base64, try to detect format. '<' is not a
+                    # base64 character, so only raw SVG markup needs the scan
+                    if image.startswith('<') and image.find('<svg', 0, 100) != -1:
                         image_format = "svg+xml"
                     else:
                         image_format = "png"  # Default
-                    rt_update = {"image_base64": image, "image_format": image_format}
+                    image_b64 = image
                     
             elif image is None:
-                rt_update = {"error": "No image data received"}
+                error = "No image data received"
                 
             else:
-                rt_update = {"error": f"Invalid image format: {type(image)}"}
+                error = f"Invalid image format: {type(image)}"
                 
         except Exception as e:
-            rt_update = {"error": f"Error processing image: {str(e)}\n{traceback.format_exc()}"}
+            image_b64 = image_format = None
+            error = f"Error processing image: {str(e)}{error_traceback()}"
         
+        # Overwrite every key of the reused dict so no stale frame data leaks through
+        rt_update = self._rt
+        rt_update["image_base64"] = image_b64
+        rt_update["image_format"] = image_format
+        rt_update["error"] = error
         return (None, rt_update)
 
+@cached_node_metadata
 class CameraNode(NodeBase):
     """A node that prompts the user to open their camera and outputs an image."""
 
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -646,9 +1077,7 @@ class CameraNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Prompt the user to open their camera and output an image."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 CameraNode
 
 Purpose: Takes a camera image stream and outputs it as an image for processing or display.
@@ -660,14 +1089,23 @@ Outputs:
   - image (IMAGE): The image from the camera stream
 
 Usage: Use this node to capture and process images from a camera. Connect it to camera input from the frontend to get live image data for further processing or display.
-        """
+    """
 
     def open_camera(self, image_stream):
+        # Parse the frame once so downstream nodes can forward it without re-encoding
+        if isinstance(image_stream, str) and image_stream.startswith('data:image/') and ',' in image_stream:
+            return (_parse_data_url(image_stream), None)
+        if isinstance(image_stream, (bytes, bytearray, memoryview)):
+            frame = memoryview(image_stream)
+            return (ImagePayload(frame, _sniff_image_format(frame)), None)
         return (image_stream, None)
 
+@cached_node_metadata
 class DisplayNode(NodeBase):
     """A node that takes ANY input and returns nothing, for display/debugging purposes."""
 
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -696,9 +1134,7 @@ class DisplayNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Display the input value (ANY type) for debugging or monitoring."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 DisplayNode
 
 Purpose: Takes any input value and displays it (prints to console). Useful for debugging or monitoring workflow data.
@@ -709,16 +1145,19 @@ Inputs:
 Outputs:
   - value (ANY): The same value that was input, for display purposes
 
-Usage: Use this node to inspect values in your workflow. It prints the value to the backend console and passes it through for display in the UI.
-        """
+Usage: Use this node to inspect values in your workflow. It passes the value through for display in the UI, and always logs it to the backend console through the queued factoryui.output handler, so logging never blocks the workflow.
+    """
 
     def display(self, value: Any):
-        print(f"[DisplayNode] Value: {value}")
+        _output_log.info("[DisplayNode] Value: %s", value)
         return (None,value)
 
+@cached_node_metadata
 class NoteNode(NodeBase):
     """A node that takes text as input and has no output, useful for adding comments or notes to workflows."""
 
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -746,9 +1185,7 @@ class NoteNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Add a note or comment to your workflow (no output)."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 NoteNode
 
 Purpose: Takes text input and produces no output. Useful for adding comments, notes, or documentation to your workflow.
@@ -760,19 +1197,51 @@ Outputs:
   - None
 
 Usage: Use this node to add documentation, comments, or notes to your workflow. The text will be visible in the node but won't affect the workflow execution.
-        """
+    """
 
     def note(self):
         pass
 
+# Arm joints in servo ID order (servo 1 is the base rotation)
+_JOINT_NAMES = ('Rotation', 'Pitch', 'Elbow', 'Wrist_Pitch', 'Wrist_Roll', 'Jaw')
+# (int, str) key pair per joint: positions may arrive with either key type
+_JOINT_KEYS = tuple((servo_id, str(servo_id)) for servo_id in range(1, len(_JOINT_NAMES) + 1))
+# Servo positions span 0..4095 over one full turn
+_POSITION_TO_DEGREES = 360.0 / 4095.0
+
+
+
+def _pack_joint_angles(joints: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Pack joint angles as base64 little-endian float16 for compact streaming"""
+    angles = struct.pack(f'<{len(joints)}e', *(joint['angle'] for joint in joints))
+    return {
+        "encoding": "f16",
+        "servo_ids": [joint['servoId'] for joint in joints],
+        "angles": _b64encode_str(angles),
+    }
+
+
+@cached_node_metadata
 class ThreeDVisualizationNode(NodeBase):
     """A node that takes motor positions and provides 3D visualization capabilities."""
 
+    __slots__ = ("_joints",)
+
+    def __init__(self):
+        # Per-joint entries reused across frames; only 'angle' changes per call
+        self._joints = [
+            {'name': name, 'angle': 0.0, 'servoId': servo_id}
+            for servo_id, name in enumerate(_JOINT_NAMES, 1)
+        ]
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
             "required": {
                 "positions": ("DICT", {})  # Expected format: {1: 1510, 2: 1029, 3: 3010, 4: 967, 5: 638, 6: 2039}
+            },
+            "optional": {
+                "compact": ("BOOLEAN", {"default": False})
             }
         }
 
@@ -799,9 +1268,7 @@ class ThreeDVisualizationNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Visualize robot positions in 3D by converting motor positions to angles."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 ThreeDVisualizationNode
 
 Purpose: Takes motor position data and converts it to joint angles for 3D visualization. This node processes motor position data and returns visualization data that can be rendered in a 3D viewer.
@@ -809,42 +1276,66 @@ Purpose: Takes motor position data and converts it to joint angles for 3D visual
 Inputs:
   - positions (DICT): Dictionary mapping servo IDs to positions in format:
     {1: 1510, 2: 1029, 3: 3010, 4: 967, 5: 638, 6: 2039}
+    A pose array [1510, 1029, 3010, 967, 638, 2039] (servo IDs 1-6 in order) is also accepted.
+
+  - compact (BOOLEAN, optional): Stream angles as packed float16 (2 bytes per joint) instead of
+    one JSON object per joint. Angles are rounded to float16 precision (~0.25 degrees).
 
 Outputs:
   - None (produces rt_update for 3D visualization)
 
 Usage: Use this node to visualize robot joint states in 3D. Connect it to nodes that provide motor position data to see the 3D representation of the robot's current configuration in the UI.
-        """
+    """
 
-    def visualize_3d(self, positions: dict):
+    def visualize_3d(self, positions, compact: bool = False):
         """
         Convert motor positions to angles and return 3D visualization data.
 
         Args:
-            positions: Dictionary mapping servo IDs to positions
+            positions: Dictionary mapping servo IDs to positions, or a pose
+                array/sequence whose i-th entry is servo i+1
 
         Returns:
             tuple: (None, rt_update)
         """
 
-        # Convert only available positions to angles
-        angle_map = {int(servo_id): (position / 4095.0) * 360.0 for servo_id, position in positions.items()}
-
-        list_of_angles = ['Rotation', 'Pitch', 'Elbow', 'Wrist_Pitch', 'Wrist_Roll', 'Jaw']
-
-        # Only include angles for servo IDs present in positions
-        angles = [
-            {'name': list_of_angles[servo_id - 1], 'angle': angle_map[servo_id], 'servoId': servo_id}
-            for servo_id in sorted(angle_map.keys())
-            if 1 <= servo_id <= len(list_of_angles)
-        ]
-
-        return (None, angles)
-
+        if not isinstance(positions, dict):
+            # Pose arrays are scaled in one vectorized step
+            if np is not None and isinstance(positions, np.ndarray):
+                degrees = (positions * _POSITION_TO_DEGREES).tolist()
+            else:
+                degrees = [position * _POSITION_TO_DEGREES for position in positions]
+            for joint, angle in zip(self._joints, degrees):
+                joint['angle'] = angle
+            angles = self._joints[:len(degrees)]
+            return (None, _pack_joint_angles(angles) if compact else angles)
 
+        # Fast path: a full frame keyed by int servo IDs, read by fixed index order
+        try:
+            for joint, (servo_id, _) in zip(self._joints, _JOINT_KEYS):
+                joint['angle'] = positions[servo_id] * _POSITION_TO_DEGREES
+            angles = self._joints
+        except KeyError:
+            # Partial frame or str keys (positions that came through JSON):
+            # only include IDs present in positions, still in servo ID order
+            angles = []
+            for joint, (servo_id, servo_key) in zip(self._joints, _JOINT_KEYS):
+                position = positions.get(servo_id)
+                if position is None:
+                    position = positions.get(servo_key)
+                if position is not None:
+                    joint['angle'] = position * _POSITION_TO_DEGREES
+                    angles.append(joint)
+
+        return (None, _pack_joint_angles(angles) if compact else angles)
+
+
+@cached_node_metadata
 class UnlockRobotNode(NodeBase):
     """Node for unlocking the robot"""
 
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -874,9 +1365,7 @@ class UnlockRobotNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Unlock the robot using ScsServoSDK"
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 UnlockRobotNode
 
 Purpose: Unlocks the robot, allowing manual or programmatic control of the servos.
@@ -890,25 +1379,32 @@ Outputs:
 Usage: Use this node to enable control mode on the robot. This is typically required before sending position commands or reading servo status. Place this node early in your workflow before other robot control nodes.
 
 Note: This operation may be required to establish proper communication with the robot's servo controller and enable command execution.
-        """
-
-    def unlock(self, sdk: ScsServoSDK) -> tuple:
-        """Unlock the robot using _unlock_servo method"""
-        import traceback
+    """
 
+    def unlock(self, sdk: "ScsServoSDK") -> tuple:
+        """Unlock the robot, disabling torque on every arm servo"""
         try:
-            for servo_id in range(1, 7):
-                sdk.write_torque_enable(servo_id, False)
+            # Synchronous on purpose: other nodes of the same level share this SDK's
+            # half-duplex bus, so the writes must not overlap theirs
+            self._disable_torque(sdk)
             return ()
         except Exception as e:
-            error_msg = str(e) + "\n" + traceback.format_exc()
-            print(f"❌ Failed to unlock robot: {error_msg}")
-            raise Exception(f"Failed to unlock robot: {error_msg}")
+            # The traceback is formatted only if the record is emitted
+            logger.exception("Failed to unlock robot")
+            raise Exception(f"Failed to unlock robot: {e}") from e
+
+    @staticmethod
+    def _disable_torque(sdk: "ScsServoSDK") -> None:
+        for servo_id in _ARM_SERVO_IDS:
+            sdk.write_torque_enable(servo_id, False)
 
 
+@cached_node_metadata
 class DisconnectRobotNode(NodeBase):
     """Node for disconnecting from the robot using ScsServoSDK"""
 
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -938,9 +1434,7 @@ class DisconnectRobotNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Disconnect from the robot using ScsServoSDK."
 
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 DisconnectRobotNode
 
 Purpose: Disconnects from the robot by calling the disconnect() method on the provided ScsServoSDK instance.
@@ -952,21 +1446,27 @@ Outputs:
   - None (this node has no outputs)
 
 Usage: Use this node at the end of your robot workflow to properly close the connection to the robot. This ensures clean disconnection and frees up system resources.
-        """
+    """
 
-    def disconnect_robot(self, sdk: ScsServoSDK) -> tuple:
-        import traceback
+    def disconnect_robot(self, sdk: "ScsServoSDK") -> tuple:
         try:
+            # Evict first so no connect hands out the SDK while it is going down
+            ConnectRobotNode.forget_sdk(sdk)
             sdk.disconnect()
             return ()  # No outputs
         except Exception as e:
-            error_msg = str(e) + "\n" + traceback.format_exc()
-            print(f"❌ Failed to disconnect robot: {error_msg}")
-            raise Exception(f"Failed to disconnect robot: {error_msg}")
+            # The traceback is formatted only if the record is emitted
+            logger.exception("Failed to disconnect robot")
+            raise Exception(f"Failed to disconnect robot: {e}") from e
 
 
+@cached_node_metadata
 class ProxyHttpSenderNode(NodeBase):
     """Send data through HTTP proxy to external clients"""
+
+    __slots__ = ()
+
+    ASYNC = True
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
@@ -1002,9 +1502,7 @@ class ProxyHttpSenderNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Send data through HTTP proxy to external clients"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 ProxyHttpSenderNode
 
 Purpose: Sends data through an HTTP proxy URL to external clients. This node makes an HTTP POST request to the specified proxy URL with the input data.
@@ -1018,14 +1516,10 @@ Outputs:
   - message (STRING): Status message describing the result
 
 Usage: Use this node to send data to external clients through any HTTP proxy service. Make sure your proxy tunnel is running and the URL is correct. The data will be sent as a JSON POST request.
-        """
+    """
     
-    def send_http(self, data: Any, proxy_url: str) -> tuple:
+    async def send_http(self, data: Any, proxy_url: str) -> tuple:
         """Send data through HTTP proxy"""
-        import json
-        import traceback
-        import requests
-        
         try:
             # Create message payload
             message = {
@@ -1034,30 +1528,43 @@ Usage: Use this node to send data to external clients through any HTTP proxy ser
             }
             
             # Send HTTP POST request
-            response = requests.post(proxy_url, json=message, timeout=10)
+            status_code, _ = await _http_post_json(proxy_url, message, timeout=10)
             
-            if response.status_code == 200:
-                print(f"✓ Sent data through HTTP proxy: {response.status_code}")
+            if status_code == 200:
+                print(f"✓ Sent data through HTTP proxy: {status_code}")
                 return (True, f"Data sent successfully to {proxy_url}")
             else:
-                error_msg = f"HTTP request failed with status {response.status_code}"
-                print(f"❌ {error_msg}")
+                error_msg = f"HTTP request failed with status {status_code}"
+                logger.error("Sending to %s failed: %s", proxy_url, error_msg)
                 return (False, error_msg)
             
         except Exception as e:
             error_msg = f"Failed to send HTTP data: {str(e)}"
-            print(f"❌ {error_msg}")
-            print(traceback.format_exc())
+            logger.error("Failed to send HTTP data to %s", proxy_url, exc_info=True)
             return (False, error_msg)
 
+@cached_node_metadata
 class ProxyHttpClientNode(NodeBase):
     """Make HTTP requests to external endpoints through proxy"""
+
+    __slots__ = ()
+
+    ASYNC = True
+    # Recent 4xx results by (url, parse_body), as (expiry, result): an endpoint that
+    # answered with a client error isn't re-requested every loop iteration until it
+    # expires. Successful responses are never cached, since continuous runs poll for fresh data
+    _CLIENT_ERROR_CACHE: ClassVar["OrderedDict[tuple, tuple]"] = OrderedDict()
+    CLIENT_ERROR_TTL = 10.0
+    MAX_CACHED_ERRORS = 256
     
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
             "required": {
                 "url": ("STRING", {"default": "https://your-proxy-endpoint.com"})
+            },
+            "optional": {
+                "parse_body": ("BOOLEAN", {"default": True})
             }
         }
     
@@ -1087,60 +1594,107 @@ class ProxyHttpClientNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Make HTTP requests to external endpoints through proxy"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 ProxyHttpClientNode
 
 Purpose: Makes HTTP GET requests to external endpoints that can be accessed through proxy tunnels. This node fetches data from the specified URL and returns the response.
 
 Inputs:
   - url (STRING): The full URL to make the HTTP request to (e.g., https://your-proxy-endpoint.com)
+  - parse_body (BOOLEAN): Whether to download and decode the response body (default: True). When False, response_data is an empty dict and only the status is checked
 
 Outputs:
   - response_data (DICT): The response data from the HTTP request (parsed JSON or error info)
   - status_code (INT): The HTTP status code of the response
   - success (BOOLEAN): True if the request was successful (status code 200-299), False otherwise
 
-Usage: Use this node to fetch data from external services through proxy tunnels. Provide the full proxy URL and the node will make a GET request and return the response data.
-        """
+Usage: Use this node to fetch data from external services through proxy tunnels. Provide the full proxy URL and the node will make a GET request and return the response data. Responses over 1 MB are stream-parsed when ijson is installed, so only the payload is decoded. A 4xx response is reused for 10 seconds before the URL is requested again.
+    """
     
-    def fetch_data(self, url: str) -> tuple:
+    async def fetch_data(self, url: str, parse_body: bool = True) -> tuple:
         """Fetch data from external HTTP endpoint"""
-        import traceback
-        import requests
+        key = (url, parse_body)
+        cached = self._CLIENT_ERROR_CACHE.get(key)
+        if cached is not None:
+            expiry, result = cached
+            if time.monotonic() < expiry:
+                return result
+            del self._CLIENT_ERROR_CACHE[key]
+
+        result = await self._fetch(url) if parse_body else await self._fetch_status(url)
+
+        if 400 <= result[1] < 500:
+            self._CLIENT_ERROR_CACHE[key] = (time.monotonic() + self.CLIENT_ERROR_TTL, result)
+            if len(self._CLIENT_ERROR_CACHE) > self.MAX_CACHED_ERRORS:
+                self._CLIENT_ERROR_CACHE.popitem(last=False)
+        return result
+
+    async def _fetch(self, url: str) -> tuple:
+        """GET url and extract data.payload; returns the node's (data, status, success) tuple"""
+        if httpx is None or ijson is None:
+            status_code, body = await _http_request("GET", url, timeout=10)
+            return self._parse_response(url, status_code, body)
+
+        async with _get_async_http_client().stream("GET", url, timeout=10) as response:
+            status_code = response.status_code
+            if int(response.headers.get("content-length") or 0) <= _STREAM_DECODE_THRESHOLD:
+                return self._parse_response(url, status_code, await response.aread())
+
+            # Large body: build only the data.payload subtree, never the whole envelope
+            try:
+                async for payload in ijson.items(_AsyncByteReader(response), "data.payload", use_float=True):
+                    return (payload, status_code, True)
+                raise KeyError("data.payload")
+            except Exception as e:
+                return self._error_result(url, status_code, e)
+
+    @staticmethod
+    async def _fetch_status(url: str) -> tuple:
+        """GET url for its status only; the body is neither downloaded nor decoded"""
+        if httpx is not None:
+            # Leaving the stream unread means the connection is closed rather than
+            # pooled, which is cheaper than draining a large body
+            async with _get_async_http_client().stream("GET", url, timeout=10) as response:
+                status_code = response.status_code
+        else:
+            status_code, _ = await _http_request("GET", url, timeout=10)
+        return ({}, status_code, 200 <= status_code < 300)
 
-        response = requests.get(url, timeout=10)
-        status_code = response.status_code
-        
+    @classmethod
+    def _parse_response(cls, url: str, status_code: int, body: bytes) -> tuple:
         try:
-            response_data = response.json()
-            
             return (
-                response_data['data']['payload'],
+                _decode_proxy_payload(body),
                 status_code,
                 True
             )
             
         except Exception as e:
-            error_msg = f"Failed to fetch data from {url}: {str(e)}"
-            print(f"❌ {error_msg}")
-            print(traceback.format_exc())
-            
-            error_data = {
-                "error": error_msg,
-                "url": url,
-            }
-            
-            return (
-                error_data,
-                status_code,
-                False
-            )
+            return cls._error_result(url, status_code, e)
 
+    @staticmethod
+    def _error_result(url: str, status_code: int, e: Exception) -> tuple:
+        error_msg = f"Failed to fetch data from {url}: {str(e)}"
+        # Called from except blocks, so exc_info picks up the active exception
+        logger.error("%s", error_msg, exc_info=True)
+        
+        error_data = {
+            "error": error_msg,
+            "url": url,
+        }
+        
+        return (
+            error_data,
+            status_code,
+            False
+        )
+
+@cached_node_metadata
 class VLMNode(NodeBase):
     """A mock Vision Language Model node"""
-    
+
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -1176,9 +1730,7 @@ class VLMNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Grok VLM"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 VLMNode
 
 Purpose: Mock Vision Language Model node that processes images with text prompts.
@@ -1192,17 +1744,20 @@ Outputs:
   - confidence (FLOAT): Confidence score of the response
 
 Usage: Use this node to simulate VLM processing. The node will pass through the inputs and return mock responses.
-        """
+    """
     
     def process_vlm(self, system_prompt: str, user_prompt: str, model_name, images) -> tuple:
         """Mock VLM processing"""
-        response = f"Mock VLM response to prompt: '{system_prompt[:50]}...' with {len(images) if hasattr(images, '__len__') else 1} image(s)"
+        response = f"Mock VLM response to prompt: '{system_prompt[:50]}...' with {_image_count(images)} image(s)"
         confidence = 0.85
         return (response, confidence)
 
+@cached_node_metadata
 class VLAModelNode(NodeBase):
     """A mock Vision Language Action model node"""
-    
+
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -1238,9 +1793,7 @@ class VLAModelNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "VLA node"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 VLAModelNode
 
 Purpose: Mock Vision Language Action model node that processes system status, prompts, and images to generate actions.
@@ -1256,7 +1809,7 @@ Outputs:
   - confidence (FLOAT): Confidence score of the action
 
 Usage: Use this node to simulate VLA model processing. The node will pass through the inputs and return mock actions and parameters.
-        """
+    """
     
     def process_vla(self, system_status: dict, prompt: str, images, model_name) -> tuple:
         """Mock VLA processing"""
@@ -1266,9 +1819,12 @@ Usage: Use this node to simulate VLA model processing. The node will pass throug
         return system_status, None
     
 
+@cached_node_metadata
 class DataRecordNode(NodeBase):
     """A mock node for data recording functionality"""
-    
+
+    __slots__ = ()
+
     @classmethod
     def INPUT_TYPES(cls) -> Dict[str, Any]:
         return {
@@ -1302,9 +1858,7 @@ class DataRecordNode(NodeBase):
     def DESCRIPTION(cls) -> str:
         return "Mock node for data recording functionality"
     
-    @classmethod
-    def get_detailed_description(cls) -> str:
-        return """
+    DETAILED_DESCRIPTION = """
 DataRecordNode
 
 Purpose: Mock node for data recording functionality. This node simulates recording data using a Hugging Face token.
@@ -1317,7 +1871,7 @@ Outputs:
   - message (STRING): Status message describing the recording result
 
 Usage: Use this node to simulate data recording operations. The node will pass through the token and return a mock success response.
-        """
+    """
     
     def record_data(self, hf_token: str) -> tuple:
         """Mock data recording functionality"""
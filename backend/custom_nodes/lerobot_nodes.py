@@ -1,13 +1,19 @@
 import os
 import sys
 import time
-import traceback
 import math
-from typing import Any, Dict, List
+import copy
+import queue
+import threading
+import inspect
+import functools
+import concurrent.futures
+import atexit
+from typing import Any, Dict, List, Set
 from pathlib import Path
 from dataclasses import dataclass
 
-from core.node_base import NodeBase
+from core.node_base import NodeBase, error_traceback
 
 import draccus
 # Add lerobot path for imports
@@ -16,18 +22,34 @@ sys.path.insert(0, lerobot_path)
 
 # Import LeRobot modules
 try:
-    from lerobot.utils.robot_utils import busy_wait
+    import numpy as np
 
     from lerobot.robots import make_robot_from_config, RobotConfig
     from lerobot.teleoperators import make_teleoperator_from_config, TeleoperatorConfig
     from lerobot.datasets.lerobot_dataset import LeRobotDataset
+    from lerobot.datasets import image_writer
     from lerobot.record import record_loop, DatasetRecordConfig
     from lerobot.utils.control_utils import init_keyboard_listener
-    from lerobot.datasets.utils import hw_to_dataset_features, build_dataset_frame
+    from lerobot.datasets.utils import hw_to_dataset_features
     from lerobot.teleoperators.keyboard import KeyboardTeleop, KeyboardTeleopConfig
+
+    # draccus parse targets for the connect nodes
+    @dataclass(frozen=True, slots=True)
+    class ConnectLeRobotConfig:
+        robot: RobotConfig
+
+    @dataclass(frozen=True, slots=True)
+    class ConnectTeleopConfig:
+        teleop: TeleoperatorConfig
 except ImportError as e:
     print(f"Warning: Could not import lerobot modules: {e}")
 
+# OpenCV is optional: it backs CreateDatasetNode's fast_image_encoder
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 # Additional imports for vision control
 # try:
 #     import cv2
@@ -42,6 +64,335 @@ except ImportError as e:
 MODULE_TAG = "LeRobot"
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_robot_config(robot_type: str, port: str, robot_id: str, cameras: str) -> "RobotConfig":
+    """Parse a RobotConfig from CLI-style arguments with draccus (memoized, parsing is slow)"""
+    args = [
+        f"--robot.type={robot_type}",
+        f"--robot.port={port}",
+        f"--robot.id={robot_id}",
+        f"--robot.cameras={cameras}",
+    ]
+    return draccus.parse(ConnectLeRobotConfig, args=args).robot
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_teleop_config(teleop_type: str, port: str, teleop_id: str) -> "TeleoperatorConfig":
+    """Parse a TeleoperatorConfig from CLI-style arguments with draccus (memoized)"""
+    args = [
+        f"--teleop.type={teleop_type}",
+        f"--teleop.port={port}",
+        f"--teleop.id={teleop_id}",
+    ]
+    return draccus.parse(ConnectTeleopConfig, args=args).teleop
+
+
+# Final stretch before a frame deadline that is spun instead of slept, to absorb
+# the scheduler's sleep overshoot
+_SPIN_MARGIN_S = 1e-3
+
+
+def _dataset_frame_layout(features: dict, prefix: str) -> tuple:
+    """Precompute what build_dataset_frame reads for each feature under prefix.
+
+    Entries are (feature key, value names, None) for float32 vectors and
+    (feature key, None, source key) for image/video features, in feature order.
+    """
+    layout = []
+    for key, ft in features.items():
+        if not key.startswith(prefix):
+            continue
+        if ft["dtype"] == "float32" and len(ft["shape"]) == 1:
+            layout.append((key, tuple(ft["names"]), None))
+        elif ft["dtype"] in ("image", "video"):
+            layout.append((key, None, key.removeprefix(f"{prefix}.images.")))
+    return tuple(layout)
+
+
+def _build_frame(layout: tuple, values: dict, frame: dict = None) -> dict:
+    """Equivalent of build_dataset_frame over a layout from _dataset_frame_layout.
+
+    Entries are added to frame when given, so several layouts can fill one dict.
+    """
+    if frame is None:
+        frame = {}
+    for key, names, source in layout:
+        if names is None:
+            frame[key] = values[source]
+        else:
+            frame[key] = np.array([values[name] for name in names], dtype=np.float32)
+    return frame
+
+
+# PNG zlib level for dataset frames when fast_png is on (Pillow's default is 6)
+_FAST_PNG_COMPRESS_LEVEL = 1
+# LeRobot's original image_writer.write_image, saved while the fast writer is installed
+_original_write_image = None
+
+
+def _cv2_write_png(image, fpath) -> None:
+    """Write a dataset frame as PNG with OpenCV's encoder, skipping the Pillow conversion"""
+    try:
+        array = np.asarray(image)
+        if array.ndim == 3 and array.shape[0] in (1, 3) and array.shape[-1] not in (1, 3):
+            array = array.transpose(1, 2, 0)  # CHW -> HWC
+        if array.dtype != np.uint8:
+            array = (array * 255).clip(0, 255).astype(np.uint8)  # float frames are in [0, 1]
+        if array.ndim == 3 and array.shape[-1] == 3:
+            array = cv2.cvtColor(array, cv2.COLOR_RGB2BGR)
+        ok, encoded = cv2.imencode(".png", array, [cv2.IMWRITE_PNG_COMPRESSION, _FAST_PNG_COMPRESS_LEVEL])
+        if not ok:
+            raise ValueError("cv2.imencode failed")
+        with open(fpath, "wb") as f:
+            f.write(encoded)
+    except Exception as e:
+        # Same as LeRobot's write_image: report and keep the writer thread alive
+        print(f"Error writing image {fpath}: {e}")
+
+
+def _set_fast_png_writes(enabled: bool, use_cv2: bool = False) -> None:
+    """Install or remove the low-compression PNG writer in LeRobot's image_writer module.
+
+    With use_cv2 (and OpenCV installed) frames are encoded by OpenCV instead of Pillow.
+    The writer threads look write_image up in the module at call time, so this must run
+    before the dataset's image writer starts. Writer processes only see it under the
+    fork start method; spawned/forkserver workers re-import LeRobot's default writer.
+    """
+    global _original_write_image
+
+    # Start from LeRobot's own writer each time so switching modes never stacks wrappers
+    if _original_write_image is not None:
+        image_writer.write_image = _original_write_image
+        _original_write_image = None
+    if not enabled:
+        return
+
+    write_image = image_writer.write_image
+    if use_cv2 and cv2 is not None:
+        fast_write_image = _cv2_write_png
+    elif "compress_level" in inspect.signature(write_image).parameters:
+        fast_write_image = functools.partial(write_image, compress_level=_FAST_PNG_COMPRESS_LEVEL)
+    else:
+        def fast_write_image(image, fpath):
+            if not isinstance(image, image_writer.PIL.Image.Image):
+                image = image_writer.image_array_to_pil_image(image)
+            image.save(fpath, compress_level=_FAST_PNG_COMPRESS_LEVEL)
+
+    _original_write_image = write_image
+    image_writer.write_image = fast_write_image
+
+
+def _image_writer_processes(requested: int, num_cameras: int) -> int:
+    """Resolve num_image_writer_processes; a negative value means one per camera, capped at half the cores"""
+    if requested >= 0:
+        return requested
+    return min(num_cameras, (os.cpu_count() or 2) // 2)
+
+
+class _FrameWriter:
+    """Adds frames to a dataset from a background thread, in order, so the control
+    loop doesn't stall on add_frame's image writes and buffer bookkeeping"""
+
+    _DONE = object()
+
+    def __init__(self, dataset, task: str, max_pending: int):
+        self._dataset = dataset
+        self._task = task
+        self._queue = queue.Queue(maxsize=max(max_pending, 1))
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="dataset-frame-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, frame: dict) -> None:
+        if self.error is not None:
+            raise self.error
+        # Blocks if the writer falls behind: dropping frames would leave gaps in
+        # the episode's timestamps
+        self._queue.put(frame)
+
+    def close(self) -> None:
+        """Wait until every queued frame has been added; re-raises a writer failure"""
+        self._queue.put(self._DONE)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _run(self) -> None:
+        while True:
+            frame = self._queue.get()
+            if frame is self._DONE:
+                return
+            if self.error is None:
+                try:
+                    self._dataset.add_frame(frame, task=self._task)
+                except Exception as e:
+                    self.error = e
+
+
+def _wait_until(deadline: float) -> float:
+    """Block until time.perf_counter() reaches deadline: sleep for the bulk, spin for the last ~1 ms.
+
+    Returns the clock reading at exit, so callers don't need another one.
+    """
+    now = time.perf_counter()
+    remaining = deadline - now
+    if remaining > 1.5 * _SPIN_MARGIN_S:
+        time.sleep(remaining - _SPIN_MARGIN_S)
+        now = time.perf_counter()
+    while now < deadline:
+        now = time.perf_counter()
+    return now
+
+
+# Hub uploads run here so the recording nodes can return before the push finishes;
+# the pending push of each dataset is kept by repo_id
+_HUB_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="hub-push")
+_HUB_PUSHES: Dict[str, concurrent.futures.Future] = {}
+# Datasets whose push waits for PostEncodeVideosNode to encode their videos
+_PUSHES_AFTER_ENCODING: Set[str] = set()
+
+
+def _push_to_hub(dataset_instance, config, async_push: bool) -> str:
+    """Push the dataset to the hub, in the background if async_push; returns the push status"""
+    if getattr(dataset_instance, "episodes_since_last_encoding", 0) > 0:
+        # Videos are still unencoded (deferred encoding); PostEncodeVideosNode pushes later
+        _PUSHES_AFTER_ENCODING.add(config.repo_id)
+        return "after_encoding"
+    if not async_push:
+        dataset_instance.push_to_hub(tags=config.tags, private=config.private)
+        return "completed"
+    _HUB_PUSHES[config.repo_id] = _HUB_EXECUTOR.submit(
+        dataset_instance.push_to_hub, tags=config.tags, private=config.private
+    )
+    return "in_progress"
+
+
+def _wait_for_hub_push(repo_id: str, timeout: float = None) -> bool:
+    """Wait for the background push of repo_id; False if it's still running after timeout.
+
+    Re-raises the push's exception if it failed.
+    """
+    future = _HUB_PUSHES.get(repo_id)
+    if future is None:
+        return True
+    done, _ = concurrent.futures.wait((future,), timeout=timeout)
+    if not done:
+        return False
+    _HUB_PUSHES.pop(repo_id, None)
+    future.result()
+    return True
+
+
+def _finish_previous_push(repo_id: str) -> None:
+    """Before recording: let a running upload of the dataset end, so it isn't uploaded mid-write"""
+    try:
+        _wait_for_hub_push(repo_id)
+    except Exception as e:
+        print(f"Warning: previous push of {repo_id} to the hub failed: {e}")
+
+
+def _defer_video_encoding(dataset_instance) -> bool:
+    """Make save_episode leave video encoding to _encode_pending_videos.
+
+    False if this LeRobot version can't batch video encoding.
+    """
+    if getattr(dataset_instance, "batch_encoding_size", None) is None:
+        return False
+    dataset_instance.batch_encoding_size = sys.maxsize
+    return True
+
+
+def _encode_pending_videos(dataset_instance) -> int:
+    """Encode the videos of the episodes saved since the last encoding; returns their count"""
+    pending = getattr(dataset_instance, "episodes_since_last_encoding", 0)
+    if pending > 0:
+        end_episode = dataset_instance.num_episodes
+        dataset_instance.batch_encode_videos(end_episode - pending, end_episode)
+        dataset_instance.episodes_since_last_encoding = 0
+    return pending
+
+
+# (listener, events) from init_keyboard_listener, shared by every recording run;
+# each call of init_keyboard_listener would start another listener thread
+_KEYBOARD_HUB = None
+
+
+def _get_keyboard_hub() -> tuple:
+    """The process-wide keyboard listener and its events dict, started on first use.
+
+    A listener that has died is replaced. The listener is None when there is no
+    display to listen on; that result is kept too.
+    """
+    global _KEYBOARD_HUB
+    if _KEYBOARD_HUB is not None:
+        listener = _KEYBOARD_HUB[0]
+        if listener is None or listener.is_alive():
+            return _KEYBOARD_HUB
+    _KEYBOARD_HUB = init_keyboard_listener()
+    listener = _KEYBOARD_HUB[0]
+    if listener is not None:
+        atexit.register(listener.stop)
+    return _KEYBOARD_HUB
+
+
+# Rate of the teleop-only loop between recorded episodes
+_RESET_FPS = 10
+
+
+def _reset_phase(robot_instance, teleop_instance, reset_time_s: float, events: dict) -> None:
+    """Let the operator reset the scene between episodes: mirror the teleoperator at _RESET_FPS.
+
+    Nothing is observed or recorded. Ends after reset_time_s, or early on the
+    stop_recording / exit_early keyboard events (exit_early is consumed, as in record_loop).
+    """
+    period = 1 / _RESET_FPS
+    start = time.perf_counter()
+    end = start + reset_time_s
+    tick = 0
+    now = start
+    while now < end:
+        if events["stop_recording"]:
+            break
+        if events["exit_early"]:
+            events["exit_early"] = False
+            break
+        if teleop_instance is not None:
+            robot_instance.send_action(teleop_instance.get_action())
+        tick += 1
+        now = _wait_until(min(start + tick * period, end))
+
+
+def _observation_reader(robot_instance):
+    """Callable returning robot_instance's observation, without get_observation's overhead when possible.
+
+    Robots whose observation is exactly "<motor>.pos" for every motor on one bus plus a
+    frame per camera (SO100/SO101, Koch, ...) are read with a single bulk
+    bus.sync_read and each camera's async_read, skipping the connection checks and
+    timing logs of get_observation. Any other robot uses get_observation.
+    """
+    bus = getattr(robot_instance, "bus", None)
+    cameras = dict(getattr(robot_instance, "cameras", None) or {})
+    motors = getattr(bus, "motors", None)
+    if motors is None or not hasattr(bus, "sync_read"):
+        return robot_instance.get_observation
+    if not all(hasattr(cam, "async_read") for cam in cameras.values()):
+        return robot_instance.get_observation
+    expected_keys = {f"{motor}.pos" for motor in motors} | set(cameras)
+    if set(robot_instance.observation_features) != expected_keys:
+        return robot_instance.get_observation
+
+    sync_read = bus.sync_read
+    camera_reads = tuple((name, cam.async_read) for name, cam in cameras.items())
+
+    def read_observation() -> dict:
+        observation = {f"{motor}.pos": value for motor, value in sync_read("Present_Position").items()}
+        for name, async_read in camera_reads:
+            observation[name] = async_read()
+        return observation
+
+    return read_observation
+
+
 class ConnectLeRobotNode(NodeBase):
     """Connect to a LeRobot robot"""
     
@@ -104,31 +455,9 @@ Usage: Use this node to establish connection with a LeRobot robot. The robot ins
     def connect_robot(self, robot_type: str, port: str, robot_id: str, cameras: str) -> tuple:
         """Connect to LeRobot robot"""
 
-        @dataclass
-        class ConnectLeRobotConfig:
-            robot: RobotConfig
-
         try:
-            @draccus.wrap()
-            def get_robot_config(cfg: ConnectLeRobotConfig) -> ConnectLeRobotConfig:
-                return cfg
-            
-            # Temporarily replace sys.argv to pass our arguments
-            original_argv = sys.argv
-            sys.argv = [
-                "dummy_script",
-                f"--robot.type={robot_type}",
-                f"--robot.port={port}",
-                f"--robot.id={robot_id}",
-                f"--robot.cameras={cameras}",
-            ]
-            
-            try:
-                record_config = get_robot_config()
-                robot_config = record_config.robot
-            finally:
-                # Restore original sys.argv
-                sys.argv = original_argv
+            # Parsed configs are cached; each robot gets its own copy to keep
+            robot_config = copy.deepcopy(_parse_robot_config(robot_type, port, robot_id, cameras))
             
             robot = make_robot_from_config(robot_config)
             robot.connect()
@@ -143,7 +472,7 @@ Usage: Use this node to establish connection with a LeRobot robot. The robot ins
             return ({"robot": robot, "type": robot_type}, robot_config.__dict__), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Failed to connect robot: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Failed to connect robot: {str(e)}{error_traceback()}"}
             return (None, rt_update)
 
 
@@ -165,7 +494,8 @@ class DatasetRecordConfigForOneEpisodeNode(NodeBase):
                 "push_to_hub": ("BOOLEAN", {"default": True}),
                 "private": ("BOOLEAN", {"default": False}),
                 "num_image_writer_processes": ("INT", {"default": 0}),
-                "num_image_writer_threads_per_camera": ("INT", {"default": 4})
+                "num_image_writer_threads_per_camera": ("INT", {"default": 4}),
+                "encode_mode": (["inline", "deferred", "raw_png"], {"default": "inline"})
             }
         }
     
@@ -209,8 +539,9 @@ Inputs:
   - video (BOOLEAN, optional): Encode frames as video
   - push_to_hub (BOOLEAN, optional): Upload to Hugging Face hub
   - private (BOOLEAN, optional): Make repository private
-  - num_image_writer_processes (INT, optional): Number of image writer processes
+  - num_image_writer_processes (INT, optional): Number of image writer processes; 0 writes from threads only, -1 picks one per camera, capped at half the CPU cores (default: 0; fast_png only applies to writer processes on platforms that fork them, e.g. not macOS)
   - num_image_writer_threads_per_camera (INT, optional): Threads per camera for image writing
+  - encode_mode (STRING, optional): When videos are encoded: "inline" after each episode, "deferred" by PostEncodeVideosNode once recording is done, "raw_png" never (frames stay PNG images, video is off) (default: "inline")
 
 Outputs:
   - dataset_config (DICT): DatasetRecordConfig object
@@ -222,7 +553,8 @@ Usage: Use this node to configure dataset recording parameters for a single epis
                             episode_time_s: float, root: str = "", video: bool = True, 
                             push_to_hub: bool = True, private: bool = False, 
                             num_image_writer_processes: int = 0,
-                            num_image_writer_threads_per_camera: int = 4) -> tuple:
+                            num_image_writer_threads_per_camera: int = 4,
+                            encode_mode: str = "inline") -> tuple:
         """Create dataset recording configuration for a single episode"""
         
         num_episodes = 1
@@ -237,7 +569,7 @@ Usage: Use this node to configure dataset recording parameters for a single epis
                 episode_time_s=episode_time_s,
                 reset_time_s=reset_time_s,
                 num_episodes=num_episodes,
-                video=video,
+                video=video and encode_mode != "raw_png",
                 push_to_hub=push_to_hub,
                 private=private,
                 num_image_writer_processes=num_image_writer_processes,
@@ -250,10 +582,10 @@ Usage: Use this node to configure dataset recording parameters for a single epis
                 "fps": fps
             }
             
-            return ({"dataset_config": dataset_config},), rt_update
+            return ({"dataset_config": dataset_config, "encode_mode": encode_mode},), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Failed to create dataset config: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Failed to create dataset config: {str(e)}{error_traceback()}"}
             return (rt_update,)
 
 
@@ -315,29 +647,8 @@ Usage: Use this node to connect to a teleoperator device for manual robot contro
     def connect_teleoperator(self, teleop_type: str, port: str, teleop_id: str) -> tuple:
         """Connect to LeRobot teleoperator"""
         
-        @dataclass
-        class ConnectTeleopConfig:
-            teleop: TeleoperatorConfig
-
         try:
-            @draccus.wrap()
-            def get_teleop_config(cfg: ConnectTeleopConfig) -> ConnectTeleopConfig:
-                return cfg
-            
-            # Temporarily replace sys.argv
-            original_argv = sys.argv
-            sys.argv = [
-                "dummy_script",
-                f"--teleop.type={teleop_type}",
-                f"--teleop.port={port}",
-                f"--teleop.id={teleop_id}",
-            ]
-            
-            try:
-                teleop_config = get_teleop_config()
-                teleop_cfg = teleop_config.teleop
-            finally:
-                sys.argv = original_argv
+            teleop_cfg = copy.deepcopy(_parse_teleop_config(teleop_type, port, teleop_id))
             
             teleoperator = make_teleoperator_from_config(teleop_cfg)
             teleoperator.connect()
@@ -359,7 +670,7 @@ Usage: Use this node to connect to a teleoperator device for manual robot contro
             return ({"init_action": init_action, "generate_action": generate_action},), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Failed to connect teleoperator: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Failed to connect teleoperator: {str(e)}{error_traceback()}"}
             return (None,), rt_update
 
 
@@ -373,6 +684,10 @@ class CreateDatasetNode(NodeBase):
                 "dataset_config": ("DICT", {}),
                 "robot": ("DICT", {}),
                 "resume": ("BOOLEAN", {"default": False})
+            },
+            "optional": {
+                "fast_png": ("BOOLEAN", {"default": True}),
+                "fast_image_encoder": ("BOOLEAN", {"default": False})
             }
         }
     
@@ -412,6 +727,8 @@ Inputs:
   - dataset_config (DICT): Dataset configuration from DatasetRecordConfigForOneEpisodeNode
   - robot (DICT): Connected robot instance from ConnectLeRobotNode
   - resume (BOOLEAN): Whether to resume recording on existing dataset
+  - fast_png (BOOLEAN, optional): Save image frames with PNG compression level 1 instead of 6, trading some disk space for much faster frame writes (default: True)
+  - fast_image_encoder (BOOLEAN, optional): With fast_png, encode frames with OpenCV instead of Pillow when OpenCV is installed (default: False)
 
 Outputs:
   - dataset (DICT): LeRobot dataset instance
@@ -420,13 +737,19 @@ Outputs:
 Usage: Use this node to create the dataset structure before recording episodes.
         """
     
-    def create_dataset(self, dataset_config: dict, robot: dict, resume: bool = False) -> tuple:
+    def create_dataset(self, dataset_config: dict, robot: dict, resume: bool = False,
+                       fast_png: bool = True, fast_image_encoder: bool = False) -> tuple:
         """Create or load LeRobot dataset"""
         
         try:
+            # Must be in place before the image writer threads/processes start
+            _set_fast_png_writes(fast_png, use_cv2=fast_image_encoder)
+
             # Reconstruct DatasetRecordConfig from dict
             config = dataset_config["dataset_config"]
             robot_instance = robot["robot"]
+            num_cameras = len(getattr(robot_instance, "cameras", ()))
+            num_processes = _image_writer_processes(config.num_image_writer_processes, num_cameras)
             
             # Create dataset features
             action_features = hw_to_dataset_features(robot_instance.action_features, "action", config.video)
@@ -440,10 +763,10 @@ Usage: Use this node to create the dataset structure before recording episodes.
                     root=config.root,
                 )
                 
-                if hasattr(robot_instance, "cameras") and len(robot_instance.cameras) > 0:
+                if num_cameras > 0:
                     dataset.start_image_writer(
-                        num_processes=config.num_image_writer_processes,
-                        num_threads=config.num_image_writer_threads_per_camera * len(robot_instance.cameras),
+                        num_processes=num_processes,
+                        num_threads=config.num_image_writer_threads_per_camera * num_cameras,
                     )
             else:
                 # Create new dataset
@@ -454,9 +777,13 @@ Usage: Use this node to create the dataset structure before recording episodes.
                     robot_type=robot_instance.name,
                     features=dataset_features,
                     use_videos=config.video,
-                    image_writer_processes=config.num_image_writer_processes,
-                    image_writer_threads=config.num_image_writer_threads_per_camera * len(robot_instance.cameras),
+                    image_writer_processes=num_processes,
+                    image_writer_threads=config.num_image_writer_threads_per_camera * num_cameras,
                 )
+
+            if config.video and dataset_config.get("encode_mode") == "deferred":
+                if not _defer_video_encoding(dataset):
+                    print("Warning: this LeRobot version can't batch video encoding; encoding after each episode")
             
             rt_update = {
                 "status": "created" if not resume else "loaded",
@@ -467,7 +794,7 @@ Usage: Use this node to create the dataset structure before recording episodes.
             return ({"dataset": dataset, "config": config}, dataset_features), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Failed to create dataset: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Failed to create dataset: {str(e)}{error_traceback()}"}
             return (None,),  rt_update
 
 
@@ -486,7 +813,8 @@ class RecordEpisodeNode(NodeBase):
                 "teleoperator": ("DICT", {}),
                 "policy": ("DICT", {}),
                 "display_data": ("BOOLEAN", {"default": False}),
-                "play_sounds": ("BOOLEAN", {"default": True})
+                "play_sounds": ("BOOLEAN", {"default": True}),
+                "async_push": ("BOOLEAN", {"default": True})
             }
         }
     
@@ -530,6 +858,7 @@ Inputs:
   - policy (DICT, optional): Policy for autonomous control
   - display_data (BOOLEAN, optional): Display camera feeds during recording
   - play_sounds (BOOLEAN, optional): Play audio notifications
+  - async_push (BOOLEAN, optional): Upload to the hub in the background and return right away; use WaitForHubPushNode to wait for the upload (default: True)
 
 Outputs:
   - recorded_dataset (DICT): Dataset with recorded episodes
@@ -540,7 +869,8 @@ Usage: Main recording node that captures robot episodes. Requires either teleope
     
     def record_episodes(self, robot: dict, dataset: dict, dataset_config: dict,
                        teleoperator: dict = None, policy: dict = None,
-                       display_data: bool = False, play_sounds: bool = True) -> tuple:
+                       display_data: bool = False, play_sounds: bool = True,
+                       async_push: bool = True) -> tuple:
         """Record episodes using LeRobot recording system"""
 
         try:
@@ -548,17 +878,19 @@ Usage: Main recording node that captures robot episodes. Requires either teleope
             dataset_instance = dataset["dataset"]
             config = dataset_config["dataset_config"]
 
-
-
             if teleoperator is None and policy is None:
                 rt_update = {"error": "Either teleoperator or policy must be provided for recording"}
                 return (None,), rt_update
             
             teleop_instance = teleoperator["teleoperator"] if teleoperator else None
             policy_instance = policy["policy"] if policy else None
-            
-            # Initialize keyboard listener for control
-            listener, events = init_keyboard_listener()
+
+            _finish_previous_push(config.repo_id)
+
+            # Keyboard control; the listener outlives this run, so clear what the last run left set
+            _, events = _get_keyboard_hub()
+            for key in events:
+                events[key] = False
             
             recorded_episodes = 0
             start_time = time.time()
@@ -582,15 +914,7 @@ Usage: Main recording node that captures robot episodes. Requires either teleope
                 if not events["stop_recording"] and (
                     (recorded_episodes < config.num_episodes - 1) or events["rerecord_episode"]
                 ):
-                    record_loop(
-                        robot=robot_instance,
-                        events=events,
-                        fps=config.fps,
-                        teleop=teleop_instance,
-                        control_time_s=config.reset_time_s,
-                        single_task=config.single_task,
-                        display_data=display_data,
-                    )
+                    _reset_phase(robot_instance, teleop_instance, config.reset_time_s, events)
                 
                 if events["rerecord_episode"]:
                     events["rerecord_episode"] = False
@@ -600,16 +924,13 @@ Usage: Main recording node that captures robot episodes. Requires either teleope
                 
                 dataset_instance.save_episode()
                 recorded_episodes += 1
-            
+
             total_time = time.time() - start_time
             
             # Push to hub if configured
+            push_status = "skipped"
             if config.push_to_hub:
-                dataset_instance.push_to_hub(tags=config.tags, private=config.private)
-            
-            # Cleanup
-            if listener is not None:
-                listener.stop()
+                push_status = _push_to_hub(dataset_instance, config, async_push)
             
             recording_stats = {
                 "episodes_recorded": recorded_episodes,
@@ -621,13 +942,14 @@ Usage: Main recording node that captures robot episodes. Requires either teleope
             rt_update = {
                 "status": "completed",
                 "episodes_recorded": recorded_episodes,
-                "total_time": f"{total_time:.1f}s"
+                "total_time": f"{total_time:.1f}s",
+                "push_status": push_status
             }
             
             return ({"dataset": dataset_instance, "config": config}, recording_stats), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Recording failed: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Recording failed: {str(e)}{error_traceback()}"}
             return (None,), rt_update
 
 
@@ -699,7 +1021,7 @@ Usage: Use this node to disable motor torque, allowing the robot to be moved man
             return ({"robot": robot_instance, "type": robot.get("type", "unknown")},), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Failed to disable torque: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Failed to disable torque: {str(e)}{error_traceback()}"}
             return (None,), rt_update
 
 
@@ -716,6 +1038,7 @@ class ControlLoopNode(NodeBase):
                 "dataset_config": ("DICT", {}),
             },
             "optional": {
+                "async_push": ("BOOLEAN", {"default": True})
             }
         }
     
@@ -724,7 +1047,8 @@ class ControlLoopNode(NodeBase):
         return {
             "required": {
                 "robot": ("DICT", {}),
-                "control_stats": ("DICT", {})
+                "control_stats": ("DICT", {}),
+                "dataset": ("DICT", {})
             }
         }
     
@@ -756,15 +1080,18 @@ Inputs:
   - action_generator (DICT): Action generator with init_action and generate_action functions
   - dataset (DICT): Dataset instance for recording
   - dataset_config (DICT): Dataset configuration with fps and episode_time_s
+  - async_push (BOOLEAN, optional): Upload to the hub in the background and return right away; use WaitForHubPushNode to wait for the upload (default: True)
 
 Outputs:
   - robot (DICT): Robot instance after control execution
   - control_stats (DICT): Statistics about the control execution
+  - dataset (DICT): The dataset, passed through once the episode is saved; wire PostEncodeVideosNode or WaitForHubPushNode here so they run after the recording
 
-Usage: Use this node to execute a control loop that applies actions to a robot. The action generator should provide init_action and generate_action functions.
+Usage: Use this node to execute a control loop that applies actions to a robot. The action generator should provide init_action and generate_action functions. The episode is pushed to the hub when saved, or by PostEncodeVideosNode when the dataset defers video encoding.
         """
     
-    def execute_control_loop(self, robot: dict, action_generator: dict, dataset: dict, dataset_config: dict) -> tuple:
+    def execute_control_loop(self, robot: dict, action_generator: dict, dataset: dict, dataset_config: dict,
+                             async_push: bool = True) -> tuple:
         """Execute a control loop with robot and action generator"""
         rt_update = {}
         try:
@@ -774,39 +1101,59 @@ Usage: Use this node to execute a control loop that applies actions to a robot.
             dataset_instance = dataset["dataset"]
             config = dataset_config["dataset_config"]
 
+            _finish_previous_push(config.repo_id)
+
             action_state = init_action(robot_instance)
+
+            # The dataset features don't change during the episode, so resolve which
+            # values feed each frame once instead of re-scanning them every frame
+            observation_layout = _dataset_frame_layout(dataset_instance.features, "observation")
+            action_layout = _dataset_frame_layout(dataset_instance.features, "action")
             
+            frame_period = 1 / config.fps
+            frame_index = 0
             timestamp = 0
+            frame_writer = _FrameWriter(dataset_instance, config.single_task, max_pending=2 * config.fps)
+            # Bound once: these run every frame
+            get_observation = _observation_reader(robot_instance)
+            send_action = robot_instance.send_action
+            add_frame = frame_writer.put
+            episode_time_s = config.episode_time_s
             start_episode_time = time.perf_counter()
-            while timestamp < config.episode_time_s:
-                start_loop_t = time.perf_counter()
-                
-                # Get current observations
-                current_obs = robot_instance.get_observation()
-
-                # Dataset
-                observation_frame = build_dataset_frame(dataset_instance.features, current_obs, prefix="observation")
-
-                action, action_state = generate_action(action_state, robot_instance, current_obs)
-
-                # Send action to robot if valid
-                if action and isinstance(action, dict):
-                    robot_instance.send_action(action)
-                    
-                # Dataset
-                action_frame = build_dataset_frame(dataset_instance.features, action, prefix="action")
-                frame = {**observation_frame, **action_frame}
-                dataset_instance.add_frame(frame, task=config.single_task)
-
-
-                dt_s = time.perf_counter() - start_loop_t
-                busy_wait(1 / config.fps - dt_s)
-
-                timestamp = time.perf_counter() - start_episode_time
+            try:
+                while timestamp < episode_time_s:
+                    # Get current observations
+                    current_obs = get_observation()
+
+                    # Dataset
+                    frame = _build_frame(observation_layout, current_obs)
+
+                    action, action_state = generate_action(action_state, robot_instance, current_obs)
+
+                    # Send action to robot if valid
+                    if action and isinstance(action, dict):
+                        send_action(action)
+                        
+                    # Dataset (a fresh frame dict each time: the writer thread may still hold the last one)
+                    add_frame(_build_frame(action_layout, action, frame))
+
+                    # Pace against absolute deadlines from the episode start, so a slow
+                    # iteration doesn't shift every later frame
+                    frame_index += 1
+                    timestamp = _wait_until(start_episode_time + frame_index * frame_period) - start_episode_time
+            except BaseException:
+                # Stop the writer thread, but report the loop's error rather than the writer's
+                try:
+                    frame_writer.close()
+                except Exception as close_error:
+                    print(f"Warning: frame writer failed while stopping: {close_error}")
+                raise
+            # Every frame must be in the episode buffer before it is saved
+            frame_writer.close()
 
             dataset_instance.save_episode()
 
-            dataset_instance.push_to_hub(tags=config.tags, private=config.private)
+            push_status = _push_to_hub(dataset_instance, config, async_push)
             
             control_stats = {
                 "total_time": time.perf_counter() - start_episode_time,
@@ -815,13 +1162,14 @@ Usage: Use this node to execute a control loop that applies actions to a robot.
             rt_update = {
                 "status": "completed",
                 "total_time": f"{control_stats['total_time']:.2f}s",
+                "push_status": push_status,
             }
             
-            return ({"robot": robot_instance, "type": robot.get("type", "unknown")}, control_stats), rt_update 
+            return ({"robot": robot_instance, "type": robot.get("type", "unknown")}, control_stats, dataset), rt_update 
             
         except Exception as e:
-            rt_update = {"error": f"Control loop failed: {str(e)}\n{traceback.format_exc()}"}
-            return ({"robot": robot_instance, "type": robot.get("type", "unknown")}, {}), rt_update
+            rt_update = {"error": f"Control loop failed: {str(e)}{error_traceback()}"}
+            return ({"robot": robot_instance, "type": robot.get("type", "unknown")}, {}, dataset), rt_update
 
 
 class DualActionGeneratorNode(NodeBase):
@@ -893,21 +1241,27 @@ Usage: Use this node to combine two different action generators (e.g., teleopera
                 state2 = gen2_init(robot_instance)
                 return {"state1": state1, "state2": state2}
             
+            # Reused every tick: the control loop is done with an action (sent, and copied
+            # into the dataset frame) before it asks for the next one
+            combined_action = {}
+            
             def generate_combined_action(action_state, robot_instance, observations):
                 """Generate combined action from both generators"""
                 # Get actions from both generators
                 action1, new_state1 = gen1_generate(action_state["state1"], robot_instance, observations)
                 action2, new_state2 = gen2_generate(action_state["state2"], robot_instance, observations)
                 
-                combined_action = {**action1, **action2}
+                # Generators may return different keys from tick to tick, so refill rather
+                # than assume a fixed layout; action2 wins on shared keys, as before
+                combined_action.clear()
+                combined_action.update(action1)
+                combined_action.update(action2)
                 
-                # Update action state
-                new_action_state = {
-                    "state1": new_state1,
-                    "state2": new_state2
-                }
+                # Update action state (the dict made by init_combined_action)
+                action_state["state1"] = new_state1
+                action_state["state2"] = new_state2
                 
-                return combined_action, new_action_state
+                return combined_action, action_state
             
             rt_update = {
                 "status": "combined"
@@ -916,10 +1270,172 @@ Usage: Use this node to combine two different action generators (e.g., teleopera
             return ({"init_action": init_combined_action, "generate_action": generate_combined_action},), rt_update
             
         except Exception as e:
-            rt_update = {"error": f"Failed to combine action generators: {str(e)}\n{traceback.format_exc()}"}
+            rt_update = {"error": f"Failed to combine action generators: {str(e)}{error_traceback()}"}
             return (None,), rt_update
 
 
+class PostEncodeVideosNode(NodeBase):
+    """Encode the videos of episodes recorded with deferred encoding"""
+    
+    @classmethod
+    def INPUT_TYPES(cls) -> Dict[str, Any]:
+        return {
+            "required": {
+                "dataset": ("DICT", {}),
+            },
+            "optional": {
+                "async_push": ("BOOLEAN", {"default": True})
+            }
+        }
+    
+    @classmethod
+    def RETURN_TYPES(cls) -> Dict[str, Any]:
+        return {
+            "required": {
+                "dataset": ("DICT", {})
+            }
+        }
+    
+    @classmethod
+    def FUNCTION(cls) -> str:
+        return "encode_videos"
+    
+    @classmethod
+    def TAGS(cls) -> List[str]:
+        return [MODULE_TAG]
+    
+    @classmethod
+    def DISPLAY_NAME(cls) -> str:
+        return "Post Encode Videos"
+    
+    @classmethod
+    def DESCRIPTION(cls) -> str:
+        return "Encode the videos of episodes recorded with deferred encoding"
+    
+    @classmethod
+    def get_detailed_description(cls) -> str:
+        return """
+PostEncodeVideosNode
+
+Purpose: Encodes the camera videos of every episode recorded since the last encoding, for datasets configured with encode_mode "deferred", then makes the hub push the recording node left for after encoding.
+
+Inputs:
+  - dataset (DICT): Dataset output of ControlLoopNode
+  - async_push (BOOLEAN, optional): Upload to the hub in the background and return right away (default: True)
+
+Outputs:
+  - dataset (DICT): The same dataset, with its videos encoded
+
+Usage: Wire this node from the recording node's dataset output, so it runs once the episodes are saved. Recording with deferred encoding keeps each episode's frames as PNG files, so recording doesn't stall on video encoding; this node encodes them in one pass (LeRobot's encoder is multi-threaded).
+        """
+    
+    def encode_videos(self, dataset: dict, async_push: bool = True) -> tuple:
+        """Encode the pending episode videos and push the dataset"""
+        
+        try:
+            dataset_instance = dataset["dataset"]
+            config = dataset["config"]
+            
+            episodes_encoded = _encode_pending_videos(dataset_instance)
+            
+            # Push only if the recording node would have pushed with inline encoding
+            push_status = "skipped"
+            if config.repo_id in _PUSHES_AFTER_ENCODING:
+                _PUSHES_AFTER_ENCODING.discard(config.repo_id)
+                push_status = _push_to_hub(dataset_instance, config, async_push)
+            
+            rt_update = {
+                "status": "encoded",
+                "episodes_encoded": episodes_encoded,
+                "push_status": push_status
+            }
+            
+            return (dataset,), rt_update
+            
+        except Exception as e:
+            rt_update = {"error": f"Video encoding failed: {str(e)}{error_traceback()}"}
+            return (dataset,), rt_update
+
+
+class WaitForHubPushNode(NodeBase):
+    """Wait for a dataset's background push to the Hugging Face hub"""
+    
+    @classmethod
+    def INPUT_TYPES(cls) -> Dict[str, Any]:
+        return {
+            "required": {
+                "dataset": ("DICT", {}),
+            },
+            "optional": {
+                "wait": ("BOOLEAN", {"default": True})
+            }
+        }
+    
+    @classmethod
+    def RETURN_TYPES(cls) -> Dict[str, Any]:
+        return {
+            "required": {
+                "dataset": ("DICT", {})
+            }
+        }
+    
+    @classmethod
+    def FUNCTION(cls) -> str:
+        return "wait_for_push"
+    
+    @classmethod
+    def TAGS(cls) -> List[str]:
+        return [MODULE_TAG]
+    
+    @classmethod
+    def DISPLAY_NAME(cls) -> str:
+        return "Wait For Hub Push"
+    
+    @classmethod
+    def DESCRIPTION(cls) -> str:
+        return "Wait for a dataset's background push to the hub"
+    
+    @classmethod
+    def get_detailed_description(cls) -> str:
+        return """
+WaitForHubPushNode
+
+Purpose: Waits for the background hub upload started by ControlLoopNode or PostEncodeVideosNode (with async_push on) and reports its outcome.
+
+Inputs:
+  - dataset (DICT): Dataset output of ControlLoopNode, or of PostEncodeVideosNode when video encoding is deferred
+  - wait (BOOLEAN, optional): Block until the upload ends; when off, only report whether it is still running (default: True)
+
+Outputs:
+  - dataset (DICT): The same dataset, passed through
+
+Usage: Wire this node from the dataset output of the node that starts the upload, so it runs after it, when the upload must be complete before the workflow moves on, e.g. before shutting down.
+        """
+    
+    def wait_for_push(self, dataset: dict, wait: bool = True) -> tuple:
+        """Wait for the dataset's background push to the hub"""
+        
+        try:
+            repo_id = dataset["config"].repo_id
+            pending = repo_id in _HUB_PUSHES
+            finished = _wait_for_hub_push(repo_id, timeout=None if wait else 0)
+            
+            if not pending:
+                status = "no_push_pending"
+            else:
+                status = "completed" if finished else "in_progress"
+            rt_update = {
+                "status": status,
+                "repo_id": repo_id
+            }
+            
+            return (dataset,), rt_update
+            
+        except Exception as e:
+            rt_update = {"error": f"Hub push failed: {str(e)}{error_traceback()}"}
+            return (dataset,), rt_update
+
+
 # Export the nodes
 NODE_CLASS_MAPPINGS = {
     "ConnectLeRobotNode": ConnectLeRobotNode,
@@ -930,4 +1446,6 @@ NODE_CLASS_MAPPINGS = {
     "DisableTorqueNode": DisableTorqueNode,
     "ControlLoopNode": ControlLoopNode,
     "DualActionGeneratorNode": DualActionGeneratorNode,
+    "PostEncodeVideosNode": PostEncodeVideosNode,
+    "WaitForHubPushNode": WaitForHubPushNode,
 }
\ No newline at end of file
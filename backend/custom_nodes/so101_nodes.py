@@ -3,6 +3,7 @@ import os
 from typing import Dict, Any, List
 import time
 import asyncio
+import traceback
 
 # Add feetech-servo-sdk to path (custom_nodes/feetech-servo-sdk)
 feetech_path = os.path.join(os.path.dirname(__file__), 'feetech-servo-sdk')
@@ -308,7 +309,6 @@ class So101WritePositionNode(NodeBase):
 
     def write_positions(self, sdk: ScsServoSDK, positions: dict) -> tuple:
         """Write positions to robot servos and pass sdk as output as well"""
-        import traceback
 
         # TODO: Remove this once we have a proper gripper
         positions[6] = positions[6] - 1000
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Executor tests: pure-chain fusion, identity folding and level scheduling (no server needed)"""
+
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.node_base import NodeBase
+from core.node_registry import node_registry
+from continuous_executor import ContinuousExecutor
+from custom_nodes.basic_nodes import InputNode, TextProcessorNode
+
+
+class _TestNode(NodeBase):
+    """Boilerplate shared by the test nodes"""
+
+    @classmethod
+    def INPUT_TYPES(cls) -> Dict[str, Any]:
+        return {"required": {}}
+
+    @classmethod
+    def RETURN_TYPES(cls) -> Dict[str, Any]:
+        return {"required": {"output": ("STRING", {})}}
+
+    @classmethod
+    def FUNCTION(cls) -> str:
+        return "execute"
+
+    @classmethod
+    def TAGS(cls) -> List[str]:
+        return ["Test"]
+
+
+class ConstTestNode(_TestNode):
+    PURE = True
+    IS_IDENTITY = True
+    FUSE_INPUT = "value"
+
+    @classmethod
+    def fuse_expression(cls, value: str, **params) -> str:
+        return value
+
+    def execute(self, value: str) -> str:
+        return value
+
+
+class UpperTestNode(_TestNode):
+    PURE = True
+    FUSE_INPUT = "text"
+
+    @classmethod
+    def fuse_expression(cls, value: str, **params) -> str:
+        return f"({value}).upper()"
+
+    def execute(self, text: str) -> str:
+        return text.upper()
+
+
+class SuffixTestNode(_TestNode):
+    PURE = True
+    FUSE_INPUT = "text"
+    # This suffix can't be fused, to exercise the node-by-node fallback
+    UNFUSABLE = "<nofuse>"
+
+    @classmethod
+    def fuse_expression(cls, value: str, suffix: str = "", **params) -> Optional[str]:
+        if suffix == cls.UNFUSABLE:
+            return None
+        return f"({value} + {suffix!r})"
+
+    def execute(self, text: str, suffix: str) -> str:
+        return text + suffix
+
+
+class SleepTestNode(_TestNode):
+    ASYNC = True
+
+    async def execute(self, seconds: float) -> str:
+        await asyncio.sleep(seconds)
+        return "slept"
+
+
+for _node_class in (ConstTestNode, UpperTestNode, SuffixTestNode, SleepTestNode,
+                    InputNode, TextProcessorNode):
+    node_registry.register_node(_node_class)
+
+
+def _chain_workflow(value: str = "abc", suffix: str = "!") -> Dict[str, Any]:
+    """const -> upper -> suffix, all pure, so the three fuse into one function"""
+    return {
+        "nodes": [
+            {"id": "const", "type": "ConstTestNode", "data": {"parameters": {"value": value}}},
+            {"id": "upper", "type": "UpperTestNode", "data": {"parameters": {}}},
+            {"id": "suffix", "type": "SuffixTestNode", "data": {"parameters": {"suffix": suffix}}},
+        ],
+        "edges": [
+            {"source": "const", "target": "upper", "sourceHandle": "output", "targetHandle": "text"},
+            {"source": "upper", "target": "suffix", "sourceHandle": "output", "targetHandle": "text"},
+        ],
+    }
+
+
+def _run_once(executor: ContinuousExecutor) -> Dict[str, Any]:
+    executor._execute_workflow_once_optimized()
+    return executor.execution_results
+
+
+def _new_executor(workflow: Dict[str, Any]) -> ContinuousExecutor:
+    executor = ContinuousExecutor()
+    assert executor.load_workflow(workflow)
+    return executor
+
+
+def test_pure_chain_is_fused():
+    executor = _new_executor(_chain_workflow())
+    results = _run_once(executor)
+
+    assert results["suffix"] == "ABC!"
+    assert executor._fused_members == {"const": "suffix", "upper": "suffix", "suffix": "suffix"}
+
+
+def test_edge_fed_parameter_is_not_baked_into_chain():
+    """A node whose operation arrives by an edge can't be compiled into a chain"""
+    workflow = {
+        "nodes": [
+            {"id": "text", "type": "InputNode", "data": {"parameters": {"value": "Hello"}}},
+            {"id": "op", "type": "InputNode", "data": {"parameters": {"value": "reverse"}}},
+            {"id": "a", "type": "TextProcessorNode", "data": {"parameters": {}}},
+            {"id": "b", "type": "TextProcessorNode", "data": {"parameters": {"operation": "lowercase"}}},
+        ],
+        "edges": [
+            {"source": "text", "target": "a", "sourceHandle": "output", "targetHandle": "text"},
+            {"source": "op", "target": "a", "sourceHandle": "output", "targetHandle": "operation"},
+            {"source": "a", "target": "b", "sourceHandle": "output", "targetHandle": "text"},
+        ],
+    }
+    executor = _new_executor(workflow)
+
+    assert _run_once(executor)["b"] == "olleh"
+    assert "a" not in executor._fused_members
+
+
+def test_parameter_update_recompiles_fused_chain():
+    executor = _new_executor(_chain_workflow())
+    _run_once(executor)
+
+    assert executor.update_node_parameter("suffix", "suffix", "?")
+    assert _run_once(executor)["suffix"] == "ABC?"
+
+    # A value the node can't fuse: the chain falls back to running node by node
+    assert executor.update_node_parameter("suffix", "suffix", SuffixTestNode.UNFUSABLE)
+    assert executor._fused_members == {}
+    assert _run_once(executor)["suffix"] == "ABC" + SuffixTestNode.UNFUSABLE
+
+
+def test_identity_constant_is_refolded_on_update():
+    executor = _new_executor(_chain_workflow(value="abc"))
+    _run_once(executor)
+    assert executor._identity_constants["const"] == "abc"
+
+    assert executor.update_node_parameter("const", "value", "xyz")
+    assert executor._identity_constants["const"] == "xyz"
+    assert _run_once(executor)["suffix"] == "XYZ!"
+
+
+def test_run_during_chain_recompile():
+    """A run that lands while update_node_parameter rebuilds a chain still finds the chain"""
+    executor = _new_executor(_chain_workflow())
+    _run_once(executor)
+
+    compile_chain = executor._compile_chain
+    results_mid_update = []
+
+    def compile_with_interleaved_run(chain):
+        # Stands in for the continuous-execution thread running mid-update
+        results_mid_update.append(_run_once(executor)["suffix"])
+        return compile_chain(chain)
+
+    executor._compile_chain = compile_with_interleaved_run
+    assert executor.update_node_parameter("suffix", "suffix", "?")
+    assert results_mid_update == ["ABC!"]
+
+    executor._compile_chain = compile_chain
+    assert _run_once(executor)["suffix"] == "ABC?"
+
+
+def test_async_nodes_of_a_level_overlap():
+    workflow = {
+        "nodes": [
+            {"id": "sleep1", "type": "SleepTestNode", "data": {"parameters": {"seconds": 0.2}}},
+            {"id": "sleep2", "type": "SleepTestNode", "data": {"parameters": {"seconds": 0.2}}},
+        ],
+        "edges": [],
+    }
+    executor = _new_executor(workflow)
+
+    start = time.perf_counter()
+    results = _run_once(executor)
+    elapsed = time.perf_counter() - start
+
+    assert results == {"sleep1": "slept", "sleep2": "slept"}
+    assert elapsed < 0.35, f"async nodes ran one after the other ({elapsed:.2f}s)"
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} passed")
+    sys.exit(1 if failed else 0)
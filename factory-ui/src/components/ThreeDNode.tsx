@@ -41,6 +41,26 @@ interface RobotModel {
   jointStates: JointState[];
 }
 
+// Decode an IEEE 754 half-precision value from its 16-bit pattern
+const halfToFloat = (bits: number): number => {
+  const sign = bits & 0x8000 ? -1 : 1;
+  const exponent = (bits >> 10) & 0x1f;
+  const fraction = bits & 0x3ff;
+  if (exponent === 0) return sign * Math.pow(2, -14) * (fraction / 1024);
+  if (exponent === 0x1f) return fraction ? NaN : sign * Infinity;
+  return sign * Math.pow(2, exponent - 15) * (1 + fraction / 1024);
+};
+
+// Expand the compact {encoding: 'f16', servo_ids, angles} rt_update into joint state objects
+const decodeCompactJointAngles = (rtUpdate: any): any => {
+  if (!rtUpdate || rtUpdate.encoding !== 'f16') return rtUpdate;
+  const raw = atob(rtUpdate.angles);
+  return rtUpdate.servo_ids.map((servoId: number, i: number) => ({
+    servoId,
+    angle: halfToFloat(raw.charCodeAt(2 * i) | (raw.charCodeAt(2 * i + 1) << 8)),
+  }));
+};
+
 const SO_ARM100_CONFIG = {
   urdfUrl: "/URDFs/so101.urdf",
   camera: { position: [-30, 10, 30] as [number, number, number], fov: 12 },
@@ -450,7 +470,7 @@ const ThreeDNode = ({ id, data, selected, ...props }: ThreeDNodeProps) => {
     // Removed debug logging to reduce console noise
     
     if (nodeState?.data?.rt_update && robotModel.robot) {
-      const rtUpdate = nodeState.data.rt_update;
+      const rtUpdate = decodeCompactJointAngles(nodeState.data.rt_update);
       // Starting rt_update conversion
       // Processing current robotModel.jointStates
       